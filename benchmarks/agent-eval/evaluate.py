@@ -10,13 +10,39 @@ Runs roam init + all analysis commands, collects scores into a structured JSON r
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import heapq
 import json
+import operator
 import os
+import shutil
 import subprocess
 import sys
 import time
+import types
 from pathlib import Path
 
+try:  # optional: 3-5x faster JSON on large payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(data: bytes | str):
+    """Parse JSON via orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj) -> str:
+    """Serialize with 2-space indent via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
 
 # Agent CLI version + model signatures
 AGENT_SIGNATURES = {
@@ -47,8 +73,28 @@ AGENT_SIGNATURES = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _roam_version() -> str:
+    """Probe roam --version once per process."""
+    if not shutil.which("roam"):
+        return "not installed"
+    try:
+        result = subprocess.run(
+            ["roam", "--version"], capture_output=True, text=True, timeout=10,
+        )
+        return result.stdout.strip().split("\n")[0]
+    except Exception:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
 def get_agent_signature(agent: str) -> dict:
-    """Detect CLI version and return full agent signature."""
+    """Detect CLI version and return full agent signature.
+
+    Memoized per agent name so the version subprocesses run once per
+    process, not once per evaluated workspace. CLIs that are not on
+    PATH are skipped without paying the subprocess spawn cost.
+    """
     sig = AGENT_SIGNATURES.get(agent, {})
     if not sig:
         return {"agent": agent, "cli_version": "unknown", "model": "unknown"}
@@ -56,22 +102,18 @@ def get_agent_signature(agent: str) -> dict:
     cli_version = "unknown"
     version_cmd = sig.get("version_cmd")
     if version_cmd:
-        try:
-            result = subprocess.run(
-                version_cmd, capture_output=True, text=True, timeout=10,
-            )
-            cli_version = result.stdout.strip().split("\n")[0]
-        except Exception:
-            pass
-
-    roam_version = "unknown"
-    try:
-        result = subprocess.run(
-            ["roam", "--version"], capture_output=True, text=True, timeout=10,
-        )
-        roam_version = result.stdout.strip().split("\n")[0]
-    except Exception:
-        pass
+        if not shutil.which(sig["cli_cmd"]):
+            cli_version = "not installed"
+        else:
+            try:
+                result = subprocess.run(
+                    version_cmd, capture_output=True, text=True, timeout=10,
+                )
+                cli_version = result.stdout.strip().split("\n")[0]
+            except Exception:
+                pass
+
+    roam_version = _roam_version()
 
     return {
         "agent": agent,
@@ -82,29 +124,33 @@ def get_agent_signature(agent: str) -> dict:
     }
 
 
-def run_roam(workspace: Path, command: str, timeout: int = 120) -> dict | None:
-    """Run a roam command with --json and return parsed output."""
+async def run_roam_async(workspace: Path, command: str, timeout: int = 120) -> dict | None:
+    """Run a roam command with --json as an async subprocess and return parsed output."""
     try:
-        result = subprocess.run(
-            ["roam", "--json", command],
+        proc = await asyncio.create_subprocess_exec(
+            "roam", "--json", command,
             cwd=str(workspace),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                return {"raw_output": result.stdout.strip(), "parse_error": True}
-        return {
-            "error": result.stderr.strip() or f"exit code {result.returncode}",
-            "returncode": result.returncode,
-        }
-    except subprocess.TimeoutExpired:
-        return {"error": "timeout", "timeout_seconds": timeout}
     except FileNotFoundError:
         return {"error": "roam not found in PATH"}
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return {"error": "timeout", "timeout_seconds": timeout}
+    if proc.returncode == 0 and stdout.strip():
+        try:
+            return loads_json(stdout)  # parses UTF-8 bytes directly
+        except ValueError:
+            out = stdout.decode("utf-8", errors="replace")
+            return {"raw_output": out.strip(), "parse_error": True}
+    return {
+        "error": stderr.decode("utf-8", errors="replace").strip() or f"exit code {proc.returncode}",
+        "returncode": proc.returncode,
+    }
 
 
 def run_roam_init(workspace: Path, timeout: int = 300) -> dict:
@@ -114,13 +160,14 @@ def run_roam_init(workspace: Path, timeout: int = 300) -> dict:
             ["roam", "init"],
             cwd=str(workspace),
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
+        # Keep the last 500 bytes and decode only that slice — no point
+        # decoding hundreds of KB of init output just to discard it.
         return {
             "success": result.returncode == 0,
-            "stdout": result.stdout.strip()[-500:],  # last 500 chars
-            "stderr": result.stderr.strip()[-500:],
+            "stdout": result.stdout[-500:].decode("utf-8", "replace").strip(),
+            "stderr": result.stderr[-500:].decode("utf-8", "replace").strip(),
         }
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "timeout"}
@@ -133,76 +180,91 @@ def check_git_init(workspace: Path) -> bool:
     git_dir = workspace / ".git"
     if git_dir.exists():
         return True
-    # Initialize git if needed
+    # Initialize git if needed — one shell, one fork instead of three
     try:
         subprocess.run(
-            ["git", "init"], cwd=str(workspace),
-            capture_output=True, timeout=30,
-        )
-        subprocess.run(
-            ["git", "add", "-A"], cwd=str(workspace),
-            capture_output=True, timeout=30,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "initial"], cwd=str(workspace),
-            capture_output=True, timeout=30,
+            ["sh", "-c", "git init -q && git add -A && git commit -q -m initial --allow-empty"],
+            cwd=str(workspace),
+            capture_output=True, timeout=60,
         )
         return True
     except Exception:
         return False
 
 
-def count_files(workspace: Path) -> dict:
-    """Count files by type in workspace."""
+SKIP_DIRS = (".git", "node_modules")
+TEST_DIRS = ("tests", "__tests__")
+
+# Extensions worth opening to count lines; everything else is counted but not read.
+# Keys are interned so membership tests hit pointer-equality fast paths.
+TEXT_EXTS = frozenset(sys.intern(x) for x in (
+    ".py", ".js", ".ts", ".tsx", ".jsx", ".mjs", ".cjs", ".vue", ".svelte", ".astro",
+    ".go", ".rs", ".java", ".kt", ".c", ".h", ".cpp", ".hpp", ".cc", ".cs", ".php",
+    ".rb", ".swift", ".scala", ".sh", ".sql", ".pl", ".lua", ".r",
+    ".md", ".rst", ".txt", ".json", ".yml", ".yaml", ".toml", ".ini", ".cfg", ".xml",
+    ".html", ".css", ".scss", ".less", ".env", ".gitignore", "(no ext)",
+))
+MAX_READ_BYTES = 5 * 1024 * 1024  # skip line-counting files larger than this
+
+
+def scan_workspace(workspace: Path) -> tuple[dict, dict]:
+    """Single walk over the workspace: file stats + test detection.
+
+    Returns (file_stats, tests) dicts. One os.walk pass replaces the
+    old rglob line-count plus five recursive test-pattern globs.
+    """
     counts = {}
     total_lines = 0
     total_files = 0
-    for f in workspace.rglob("*"):
-        if f.is_file() and ".git" not in f.parts and "node_modules" not in f.parts:
-            ext = f.suffix.lower() or "(no ext)"
+    test_files = []
+    test_count = 0
+    workspace_str = str(workspace)
+    # Hot loop: plain strings + pre-bound os.path helpers, no Path objects
+    splitext = os.path.splitext
+    path_join = os.path.join
+    for root, dirs, files in os.walk(workspace_str):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        rel_root = os.path.relpath(root, workspace_str)
+        in_test_dir = any(part in TEST_DIRS for part in rel_root.split(os.sep))
+        for name in files:
+            ext = sys.intern(splitext(name)[1].lower() or "(no ext)")
             counts[ext] = counts.get(ext, 0) + 1
             total_files += 1
+            lower = name.lower()
+            if in_test_dir or "test" in lower or "spec" in lower:
+                test_count += 1
+                if len(test_files) < 20:  # cap stored paths at 20
+                    test_files.append(path_join(rel_root, name) if rel_root != "." else name)
+            if ext not in TEXT_EXTS:
+                continue  # binary/asset: count it, don't read it
+            full = path_join(root, name)
             try:
-                total_lines += len(f.read_text(encoding="utf-8", errors="ignore").splitlines())
-            except Exception:
+                if os.stat(full).st_size > MAX_READ_BYTES:
+                    continue
+                # Count raw newlines in chunks: no Path objects, no decoding.
+                with open(full, "rb") as fh:
+                    while chunk := fh.read(1 << 16):
+                        total_lines += chunk.count(b"\n")
+            except OSError:
                 pass
-    return {
+    file_stats = {
         "total_files": total_files,
         "total_lines": total_lines,
-        "by_extension": dict(sorted(counts.items(), key=lambda x: -x[1])),
+        # Top 50 extensions via bounded heap — no full sort of the tail
+        "by_extension": dict(heapq.nlargest(50, counts.items(), key=operator.itemgetter(1))),
     }
-
-
-def check_tests_exist(workspace: Path) -> dict:
-    """Check if test files exist."""
-    test_patterns = [
-        "**/*test*.*", "**/*spec*.*", "**/test_*.*",
-        "**/tests/**/*.*", "**/__tests__/**/*.*",
-    ]
-    test_files = set()
-    for pattern in test_patterns:
-        for f in workspace.glob(pattern):
-            if f.is_file() and ".git" not in str(f) and "node_modules" not in str(f):
-                test_files.add(str(f.relative_to(workspace)))
-
-    return {
-        "tests_found": len(test_files) > 0,
-        "test_file_count": len(test_files),
-        "test_files": sorted(test_files)[:20],  # cap at 20
+    tests = {
+        "tests_found": test_count > 0,
+        "test_file_count": test_count,
+        "test_files": sorted(test_files),
     }
+    return file_stats, tests
 
 
-def check_readme_exists(workspace: Path) -> bool:
-    """Check if README exists."""
-    for name in ["README.md", "README.rst", "README.txt", "README"]:
-        if (workspace / name).exists():
-            return True
-    return False
+README_NAMES = frozenset({"README.md", "README.rst", "README.txt", "README"})
 
-
-def check_build_config(workspace: Path) -> dict:
-    """Check for build/project config files."""
-    configs = {
+CONFIG_MAP = types.MappingProxyType({
+    sys.intern(k): v for k, v in {
         "package.json": "node",
         "pyproject.toml": "python",
         "setup.py": "python",
@@ -213,19 +275,95 @@ def check_build_config(workspace: Path) -> dict:
         "vite.config.js": "vite",
         "vite.config.ts": "vite",
         "astro.config.mjs": "astro",
-    }
-    found = {}
-    for filename, build_type in configs.items():
-        if (workspace / filename).exists():
-            found[filename] = build_type
+    }.items()
+})
+
+
+def scan_root(workspace: Path) -> dict:
+    """One scandir of the workspace root: README + build-config detection.
+
+    Replaces ~14 per-name exists() stat calls with a single directory
+    listing shared by both checks.
+    """
+    try:
+        with os.scandir(workspace) as it:
+            names = {e.name for e in it if e.is_file()}
+    except OSError:
+        names = set()
+    found = {n: CONFIG_MAP[n] for n in names & CONFIG_MAP.keys()}
     return {
-        "has_build_config": len(found) > 0,
-        "configs_found": found,
+        "readme": bool(names & README_NAMES),
+        "build": {
+            "has_build_config": len(found) > 0,
+            "configs_found": found,
+        },
     }
 
 
-def evaluate_workspace(workspace: Path) -> dict:
-    """Run full evaluation on a workspace. Returns structured results."""
+def check_readme_exists(workspace: Path) -> bool:
+    """Check if README exists."""
+    return scan_root(workspace)["readme"]
+
+
+def check_build_config(workspace: Path) -> dict:
+    """Check for build/project config files."""
+    return scan_root(workspace)["build"]
+
+
+# Bump when the result structure or scoring changes to invalidate caches
+EVAL_SCHEMA_VERSION = 1
+CACHE_DIR = Path(".roam-eval-cache")
+
+
+def _cache_key(workspace: Path) -> str | None:
+    """Cache key for a workspace state, or None when it has no git HEAD."""
+    try:
+        head = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(workspace), stderr=subprocess.DEVNULL, timeout=10,
+        ).strip().decode()
+    except Exception:
+        return None
+    raw = f"{workspace}|{head}|{_roam_version()}|{EVAL_SCHEMA_VERSION}"
+    return hashlib.blake2b(raw.encode()).hexdigest()
+
+
+def _cache_load(key: str | None) -> dict | None:
+    if not key:
+        return None
+    try:
+        with open(CACHE_DIR / f"{key}.json", "rb") as fh:
+            return loads_json(fh.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_store(key: str | None, results: dict) -> None:
+    if not key:
+        return
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        (CACHE_DIR / f"{key}.json").write_text(dumps_json(results), encoding="utf-8")
+    except OSError:
+        pass
+
+
+async def evaluate_workspace_async(workspace: Path) -> dict:
+    """Run full evaluation on a workspace. Returns structured results.
+
+    Blocking steps (walk, git init, roam init) run in worker threads so
+    several workspaces can be evaluated concurrently via evaluate_many.
+
+    Results are memoized on disk keyed by (git HEAD, roam version,
+    evaluator schema version), so re-running the benchmark matrix over
+    unchanged workspaces is near-instant.
+    """
+    cache_key = _cache_key(workspace)
+    cached = _cache_load(cache_key)
+    if cached is not None:
+        print(f"  Using cached result for {workspace}")
+        return cached
+
     results = {
         "workspace": str(workspace),
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
@@ -235,32 +373,35 @@ def evaluate_workspace(workspace: Path) -> dict:
         "scores": {},
     }
 
-    # --- File stats ---
-    results["file_stats"] = count_files(workspace)
-    results["structure"]["tests"] = check_tests_exist(workspace)
-    results["structure"]["readme"] = check_readme_exists(workspace)
-    results["structure"]["build"] = check_build_config(workspace)
+    # --- File stats (single walk) ---
+    results["file_stats"], results["structure"]["tests"] = await asyncio.to_thread(
+        scan_workspace, workspace
+    )
+    root_info = scan_root(workspace)
+    results["structure"]["readme"] = root_info["readme"]
+    results["structure"]["build"] = root_info["build"]
 
     # --- Git init (roam needs it) ---
-    if not check_git_init(workspace):
+    if not await asyncio.to_thread(check_git_init, workspace):
         results["roam"]["error"] = "Could not initialize git"
         results["scores"] = _empty_scores()
         return results
 
     # --- Roam init ---
     print(f"  Running roam init...")
-    init_result = run_roam_init(workspace)
+    init_result = await asyncio.to_thread(run_roam_init, workspace)
     results["roam"]["init"] = init_result
     if not init_result.get("success"):
         results["roam"]["error"] = "roam init failed"
         results["scores"] = _empty_scores()
         return results
 
-    # --- Roam analysis commands ---
+    # --- Roam analysis commands (independent, run concurrently) ---
     commands = ["health", "dead", "complexity", "coupling"]
-    for cmd in commands:
-        print(f"  Running roam {cmd}...")
-        results["roam"][cmd] = run_roam(workspace, cmd)
+    print(f"  Running roam {', '.join(commands)}...")
+    outputs = await asyncio.gather(*(run_roam_async(workspace, c) for c in commands))
+    for cmd, output in zip(commands, outputs):
+        results["roam"][cmd] = output
 
     # --- Extract scores ---
     results["scores"] = extract_scores(results["roam"])
@@ -270,47 +411,81 @@ def evaluate_workspace(workspace: Path) -> dict:
     aqs = compute_aqs(results)
     results["aqs"] = aqs
 
+    # Cache key was computed before git/roam init; recompute if the
+    # workspace only just became a git repo.
+    _cache_store(cache_key or _cache_key(workspace), results)
     return results
 
 
+def evaluate_workspace(workspace: Path) -> dict:
+    """Synchronous wrapper around evaluate_workspace_async."""
+    return asyncio.run(evaluate_workspace_async(workspace))
+
+
+async def evaluate_many(paths: list[Path], max_parallel: int = 4) -> list[dict]:
+    """Evaluate several workspaces concurrently under a semaphore."""
+    sem = asyncio.Semaphore(max_parallel)
+
+    async def one(path: Path) -> dict:
+        async with sem:
+            return await evaluate_workspace_async(path)
+
+    return await asyncio.gather(*(one(p) for p in paths))
+
+
+def dig(d, *path, default=None):
+    """Walk nested dicts along *path*; return *default* on any miss."""
+    for key in path:
+        d = d.get(key) if isinstance(d, dict) else None
+        if d is None:
+            return default
+    return d
+
+
+# (dest_key, command, default, *candidate paths tried in order)
+_SCORE_FIELDS = [
+    ("health",                    "health",     None, ("health_score",), ("summary", "health_score")),
+    ("health_verdict",            "health",     None, ("summary", "verdict")),
+    ("tangle_ratio",              "health",     None, ("tangle_ratio",), ("summary", "tangle_ratio")),
+    ("propagation_cost",          "health",     None, ("propagation_cost",)),
+    ("issue_count",               "health",     None, ("issue_count",)),
+    ("avg_complexity",            "complexity", None, ("summary", "average_complexity")),
+    ("p90_complexity",            "complexity", None, ("summary", "p90_complexity")),
+    ("high_complexity_count",     "complexity", 0,    ("summary", "high_count")),
+    ("critical_complexity_count", "complexity", 0,    ("summary", "critical_count")),
+    ("coupling_pairs",            "coupling",   0,    ("summary", "pairs")),
+    ("hidden_coupling",           "coupling",   0,    ("summary", "hidden_coupling")),
+]
+
+
 def extract_scores(roam_results: dict) -> dict:
     """Extract numeric scores from roam JSON output."""
     scores = {}
 
-    # Health score (0-100) — also includes tangle_ratio
-    health = roam_results.get("health")
-    if health and isinstance(health, dict):
-        scores["health"] = health.get("health_score", health.get("summary", {}).get("health_score"))
-        scores["health_verdict"] = health.get("summary", {}).get("verdict")
-        scores["tangle_ratio"] = health.get("tangle_ratio", health.get("summary", {}).get("tangle_ratio"))
-        scores["propagation_cost"] = health.get("propagation_cost")
-        scores["issue_count"] = health.get("issue_count")
-        severity = health.get("severity", health.get("summary", {}).get("severity", {}))
-        scores["critical_issues"] = severity.get("CRITICAL", 0)
-        scores["warning_issues"] = severity.get("WARNING", 0)
-
-    # Dead code count
+    for dest, cmd, default, *paths in _SCORE_FIELDS:
+        src = roam_results.get(cmd)
+        if not src or not isinstance(src, dict):
+            continue
+        value = default
+        for path in paths:
+            found = dig(src, *path)
+            if found is not None:
+                value = found
+                break
+        scores[dest] = value
+
+    # Dead code: sum safe + review counts (intentional are OK)
     dead = roam_results.get("dead")
     if dead and isinstance(dead, dict):
         summary = dead.get("summary", {})
-        # sum safe + review counts (intentional are OK)
         scores["dead_symbols"] = summary.get("safe", 0) + summary.get("review", 0)
 
-    # Complexity
-    complexity = roam_results.get("complexity")
-    if complexity and isinstance(complexity, dict):
-        summary = complexity.get("summary", {})
-        scores["avg_complexity"] = summary.get("average_complexity")
-        scores["p90_complexity"] = summary.get("p90_complexity")
-        scores["high_complexity_count"] = summary.get("high_count", 0)
-        scores["critical_complexity_count"] = summary.get("critical_count", 0)
-
-    # Coupling
-    coupling = roam_results.get("coupling")
-    if coupling and isinstance(coupling, dict):
-        summary = coupling.get("summary", {})
-        scores["coupling_pairs"] = summary.get("pairs", 0)
-        scores["hidden_coupling"] = summary.get("hidden_coupling", 0)
+    # Severity buckets live under health.severity or health.summary.severity
+    health = roam_results.get("health")
+    if health and isinstance(health, dict):
+        severity = health.get("severity", dig(health, "summary", "severity", default={})) or {}
+        scores["critical_issues"] = severity.get("CRITICAL", 0)
+        scores["warning_issues"] = severity.get("WARNING", 0)
 
     return scores
 
@@ -334,13 +509,40 @@ def _empty_scores() -> dict:
 
 def main():
     parser = argparse.ArgumentParser(description="Evaluate agent workspace with roam")
-    parser.add_argument("workspace", type=Path, help="Path to agent workspace")
+    parser.add_argument("workspace", type=Path, nargs="?", help="Path to agent workspace")
     parser.add_argument("--output", "-o", type=Path, help="Output JSON file")
     parser.add_argument("--agent", type=str, help="Agent name (claude-code, codex, gemini-cli)")
     parser.add_argument("--mode", type=str, help="Mode (vanilla, roam-cli, roam-mcp)")
     parser.add_argument("--task", type=str, help="Task ID (react-todo, etc.)")
+    parser.add_argument("--batch", type=Path,
+                        help="File listing workspace paths (one per line); evaluates them concurrently")
+    parser.add_argument("--max-parallel", type=int, default=4,
+                        help="Concurrent workspaces in --batch mode (default: 4)")
     args = parser.parse_args()
 
+    if args.batch:
+        paths = [
+            Path(line).resolve()
+            for line in args.batch.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+        bad = [p for p in paths if not p.is_dir()]
+        if bad:
+            print(f"Error: not directories: {', '.join(str(p) for p in bad)}")
+            sys.exit(1)
+        print(f"Evaluating {len(paths)} workspaces (max {args.max_parallel} in parallel)")
+        batch_results = asyncio.run(evaluate_many(paths, args.max_parallel))
+        output_json = dumps_json(batch_results)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(output_json, encoding="utf-8")
+            print(f"\nResults saved to: {args.output}")
+        else:
+            print("\n" + output_json)
+        return
+
+    if not args.workspace:
+        parser.error("workspace is required unless --batch is given")
     workspace = args.workspace.resolve()
     if not workspace.is_dir():
         print(f"Error: {workspace} is not a directory")
@@ -359,7 +561,7 @@ def main():
         results["task"] = args.task
 
     # Output
-    output_json = json.dumps(results, indent=2, default=str)
+    output_json = dumps_json(results)
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
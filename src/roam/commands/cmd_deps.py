@@ -2,7 +2,7 @@
 
 import click
 
-from roam.db.connection import open_db
+from roam.db.connection import open_db, batched_in
 from roam.db.queries import FILE_BY_PATH, FILE_IMPORTS, FILE_IMPORTED_BY
 from roam.output.formatter import format_table, to_json, json_envelope
 from roam.commands.resolve import ensure_index
@@ -22,10 +22,25 @@ def deps(ctx, path, full):
     with open_db(readonly=True) as conn:
         frow = conn.execute(FILE_BY_PATH, (path,)).fetchone()
         if frow is None:
-            frow = conn.execute(
-                "SELECT * FROM files WHERE path LIKE ? LIMIT 1",
-                (f"%{path}",),
-            ).fetchone()
+            # Suffix match via the reversed-path index: a B-tree range
+            # seek instead of a full-scan LIKE '%path'.  Legacy indexes
+            # opened readonly never ran the migration and lack the
+            # column, so keep the LIKE scan as the fallback.
+            rev = path[::-1]
+            try:
+                frow = conn.execute(
+                    "SELECT * FROM files WHERE path_reversed >= ? AND path_reversed < ? LIMIT 1",
+                    (rev, rev + "\uffff"),
+                ).fetchone()
+            except Exception:
+                frow = None  # Column missing on un-migrated legacy indexes
+            if frow is None:
+                # LIKE also catches case-insensitive matches the binary
+                # range seek cannot see
+                frow = conn.execute(
+                    "SELECT * FROM files WHERE path LIKE ? LIMIT 1",
+                    (f"%{path}",),
+                ).fetchone()
         if frow is None:
             click.echo(f"File not found in index: {path}")
             raise SystemExit(1)
@@ -34,18 +49,23 @@ def deps(ctx, path, full):
         imports = conn.execute(FILE_IMPORTS, (frow["id"],)).fetchall()
         used_from: dict = {}
         if imports:
-            import_file_ids = set(i["id"] for i in imports)
-            sym_edges = conn.execute(
-                "SELECT s_tgt.file_id as tgt_fid, s_tgt.name as tgt_name "
+            # Group in SQL: one aggregated row per imported file instead of
+            # one row per symbol edge filtered and bucketed in Python.
+            sym_edges = batched_in(
+                conn,
+                "SELECT s_tgt.file_id AS tgt_fid, "
+                "GROUP_CONCAT(DISTINCT s_tgt.name) AS names "
                 "FROM edges e "
                 "JOIN symbols s_src ON e.source_id = s_src.id "
                 "JOIN symbols s_tgt ON e.target_id = s_tgt.id "
-                "WHERE s_src.file_id = ? AND s_tgt.file_id != ?",
-                (frow["id"], frow["id"]),
-            ).fetchall()
+                "WHERE s_src.file_id = ? AND s_tgt.file_id IN ({ph}) "
+                "GROUP BY s_tgt.file_id",
+                [i["id"] for i in imports],
+                pre=[frow["id"]],
+            )
             for se in sym_edges:
-                if se["tgt_fid"] in import_file_ids:
-                    used_from.setdefault(se["tgt_fid"], set()).add(se["tgt_name"])
+                if se["names"]:
+                    used_from[se["tgt_fid"]] = set(se["names"].split(","))
 
         # --- Imported by ---
         imported_by = conn.execute(FILE_IMPORTED_BY, (frow["id"],)).fetchall()
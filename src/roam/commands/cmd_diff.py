@@ -119,7 +119,7 @@ def _collect_fitness_violations(conn, file_map, root):
 
     Returns (rule_results, violations) lists.
     """
-    from roam.commands.cmd_fitness import _load_rules
+    from roam.commands.cmd_fitness import _load_rules, _RunContext
 
     rules = _load_rules(root)
     if not rules:
@@ -130,6 +130,7 @@ def _collect_fitness_violations(conn, file_map, root):
 
     all_violations = []
     rule_results = []
+    run_ctx = _RunContext()
 
     for rule in rules:
         rtype = rule.get("type", "")
@@ -138,7 +139,7 @@ def _collect_fitness_violations(conn, file_map, root):
         if rtype == "dependency":
             violations = _check_dep_rule_scoped(rule, conn, changed_paths)
         elif rtype == "metric":
-            violations = _check_metric_rule_scoped(rule, conn, changed_fids)
+            violations = _check_metric_rule_scoped(rule, conn, changed_fids, run_ctx)
         elif rtype == "naming":
             violations = _check_naming_rule_scoped(rule, conn, changed_fids)
 
@@ -192,7 +193,7 @@ def _check_dep_rule_scoped(rule, conn, changed_paths):
     return violations
 
 
-def _check_metric_rule_scoped(rule, conn, changed_fids):
+def _check_metric_rule_scoped(rule, conn, changed_fids, run_ctx=None):
     """Check metric rules scoped to changed files where applicable."""
     from roam.output.formatter import loc
 
@@ -230,11 +231,11 @@ def _check_metric_rule_scoped(rule, conn, changed_fids):
     elif metric in ("cycles", "health_score"):
         # Global metrics -- delegate to full checker
         from roam.commands.cmd_fitness import _check_metric_rule
-        violations = _check_metric_rule(rule, conn)
+        violations = _check_metric_rule(rule, conn, run_ctx)
     # Other count-based metrics run globally too
     elif metric in ("god_components", "bottlenecks", "dead_exports"):
         from roam.commands.cmd_fitness import _check_metric_rule
-        violations = _check_metric_rule(rule, conn)
+        violations = _check_metric_rule(rule, conn, run_ctx)
 
     return violations
 
@@ -57,11 +57,15 @@ from __future__ import annotations
 
 import fnmatch
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 import click
 
-from roam.db.connection import open_db, find_project_root
+from roam.db.connection import find_project_root, get_connection, get_db_path
 from roam.commands.resolve import ensure_index
 from roam.output.formatter import loc, to_json, json_envelope
 
@@ -89,6 +93,26 @@ def _load_rules(project_root: Path) -> list[dict]:
     return data["rules"]
 
 
+# Matches "key: value" lines, with an optional leading list dash
+_YAML_LINE_RE = re.compile(r"^(-\s*)?([A-Za-z_][\w-]*)\s*:\s*(.*)$")
+_YAML_BOOLS = {"true": True, "false": False}
+
+
+def _coerce_yaml_value(val: str):
+    """Convert a scalar string to bool/int/float where it parses as one."""
+    as_bool = _YAML_BOOLS.get(val.lower())
+    if as_bool is not None:
+        return as_bool
+    try:
+        return int(val)
+    except ValueError:
+        pass
+    try:
+        return float(val)
+    except ValueError:
+        return val
+
+
 def _parse_simple_yaml(path: Path) -> list[dict]:
     """Minimal YAML parser for fitness rules (no PyYAML dependency)."""
     text = path.read_text(encoding="utf-8")
@@ -100,28 +124,18 @@ def _parse_simple_yaml(path: Path) -> list[dict]:
         if not stripped or stripped.startswith("#"):
             continue
 
-        if stripped.startswith("- name:"):
+        m = _YAML_LINE_RE.match(stripped)
+        if m is None:
+            continue
+        dash, key, val = m.groups()
+        val = val.strip().strip('"').strip("'")
+
+        if dash and key == "name":
             if current_rule:
                 rules.append(current_rule)
-            current_rule = {"name": stripped.split(":", 1)[1].strip().strip('"').strip("'")}
-        elif current_rule and ":" in stripped:
-            key, val = stripped.split(":", 1)
-            key = key.strip()
-            val = val.strip().strip('"').strip("'")
-            # Type conversions
-            if val.lower() == "true":
-                val = True
-            elif val.lower() == "false":
-                val = False
-            else:
-                try:
-                    val = int(val)
-                except ValueError:
-                    try:
-                        val = float(val)
-                    except ValueError:
-                        pass
-            current_rule[key] = val
+            current_rule = {"name": val}
+        elif current_rule:
+            current_rule[key] = _coerce_yaml_value(val)
 
     if current_rule:
         rules.append(current_rule)
@@ -131,48 +145,277 @@ def _parse_simple_yaml(path: Path) -> list[dict]:
 
 # ── Rule checkers ────────────────────────────────────────────────────
 
-def _check_dependency_rule(rule, conn) -> list[dict]:
-    """Check a dependency constraint rule.
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile an fnmatch glob to a regex, cached across rules and runs."""
+    return re.compile(fnmatch.translate(pattern))
 
-    Verifies that symbols in 'from' glob don't have edges to symbols
-    in 'to' glob (or vice versa if allow=true).
+
+@lru_cache(maxsize=256)
+def _compile_rule(pattern: str, exclude: str = ""):
+    """Compile a naming rule's pattern/exclude pair, cached across runs."""
+    return re.compile(pattern), re.compile(exclude) if exclude else None
+
+
+# Stop collecting after this many violations for a single rule when a
+# --rule filter narrows the run; a rule that fails hundreds of times is
+# already unambiguous.  Full runs stay uncapped so reported counts are
+# exact.
+MAX_VIOLATIONS_PER_RULE = 200
+
+_DEP_ROWS_SQL = """SELECT e.source_id, e.target_id, e.kind, e.line,
+          sf.path as source_path, tf.path as target_path,
+          ss.name as source_name, ts.name as target_name
+   FROM edges e
+   JOIN symbols ss ON e.source_id = ss.id
+   JOIN symbols ts ON e.target_id = ts.id
+   JOIN files sf ON ss.file_id = sf.id
+   JOIN files tf ON ts.file_id = tf.id"""
+
+
+class _RunContext:
+    """Per-run cache shared across rule checks.
+
+    Multiple rules may need the symbol graph (cycles, health_score) —
+    build it once and reuse instead of rebuilding per rule.  Lazy
+    getters are guarded by a re-entrant lock so rules evaluated on
+    worker threads never build the same cache twice.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._graph = None
+        self._adjacency = None
+        self._cycles = None
+        self._dep_rows = None
+        self._dep_dir_index = None
+        self._symbols_by_kind = {}
+        self._counts = None
+        self._top_complexity = None
+
+    def get_graph(self, conn):
+        with self._lock:
+            if self._graph is None:
+                from roam.graph.builder import build_symbol_graph
+                self._graph = build_symbol_graph(conn)
+            return self._graph
+
+    def get_adjacency(self, conn):
+        """Plain adjacency dict shared by cycle/degree checks.
+
+        Far cheaper than the full networkx graph when rules only need
+        SCC membership (cycles, health_score).
+        """
+        with self._lock:
+            if self._adjacency is None:
+                from roam.graph.cycles import build_adjacency
+                self._adjacency = build_adjacency(conn)
+            return self._adjacency
+
+    def get_cycles(self, conn):
+        with self._lock:
+            if self._cycles is None:
+                from roam.graph.cycles import find_cycles
+                self._cycles = find_cycles(self.get_graph(conn))
+            return self._cycles
+
+    def get_dep_rows(self, conn):
+        """Edge rows joined with symbol names and file paths, fetched once.
+
+        Every dependency rule scans the same join; with N dep rules the
+        old code ran the query N times.
+        """
+        with self._lock:
+            if self._dep_rows is None:
+                self._dep_rows = conn.execute(_DEP_ROWS_SQL).fetchall()
+            return self._dep_rows
+
+    def get_dep_rows_filtered(self, conn, from_pattern, to_pattern):
+        """Dependency rows for one rule, pre-filtered in SQL when possible.
+
+        SQLite GLOB shares fnmatch's ``*`` and ``?`` semantics, so
+        class-free patterns can be pushed into the WHERE clause and skip
+        non-matching rows before they cross into Python.  Character
+        classes differ subtly between the two, so those patterns (and
+        runs where the full join is already cached) fall back to the
+        shared fetch; callers keep their fnmatch second pass either way.
+        """
+        if self._dep_rows is not None:
+            return self._dep_rows
+        if "[" in from_pattern or "[" in to_pattern:
+            return self.get_dep_rows(conn)
+
+        where = []
+        params = []
+        if from_pattern not in ("**", "*"):
+            where.append("sf.path GLOB ?")
+            params.append(from_pattern)
+        if to_pattern not in ("**", "*"):
+            where.append("tf.path GLOB ?")
+            params.append(to_pattern)
+        if not where:
+            return self.get_dep_rows(conn)
+
+        # One-shot filtered query: stream the cursor, no fetchall
+        return conn.execute(
+            _DEP_ROWS_SQL + " WHERE " + " AND ".join(where), params
+        )
+
+    def get_dep_dir_index(self, conn):
+        """Index cached dependency rows by the source path's first segment.
+
+        Lets rules whose 'from' glob starts with a literal directory
+        (e.g. ``src/handlers/**``) prune to that directory's rows before
+        any regex matching.  Patterns starting with a wildcard fall back
+        to the full linear scan.
+        """
+        with self._lock:
+            if self._dep_dir_index is None:
+                index: dict[str, list[int]] = {}
+                for i, r in enumerate(self.get_dep_rows(conn)):
+                    seg = r["source_path"].split("/", 1)[0]
+                    index.setdefault(seg, []).append(i)
+                self._dep_dir_index = index
+            return self._dep_dir_index
+
+    def get_counts(self, conn):
+        """Count metrics (dead_exports, god_components, bottlenecks).
+
+        All three are computed in a single round trip and cached, so
+        multiple count-metric rules cost one query total.
+        """
+        with self._lock:
+            if self._counts is not None:
+                return self._counts
+            try:
+                # is_dead_export is precomputed by the indexer, so the
+                # dead-export count is a plain scan instead of a join
+                row = conn.execute(
+                    """SELECT
+                         (SELECT COUNT(*) FROM symbols
+                          WHERE is_dead_export = 1) AS dead_exports,
+                         (SELECT COUNT(*) FROM graph_metrics
+                          WHERE in_degree + out_degree > 20) AS god_components,
+                         (SELECT COUNT(*) FROM graph_metrics
+                          WHERE betweenness > 0.1) AS bottlenecks"""
+                ).fetchone()
+            except Exception:
+                # Index predates the is_dead_export column (readonly
+                # connections never migrate) — fall back to the join
+                row = conn.execute(
+                    """SELECT
+                         (SELECT COUNT(*) FROM symbols s
+                          LEFT JOIN graph_metrics gm ON s.id = gm.symbol_id
+                          WHERE s.is_exported = 1
+                          AND (gm.in_degree IS NULL OR gm.in_degree = 0))
+                             AS dead_exports,
+                         (SELECT COUNT(*) FROM graph_metrics
+                          WHERE in_degree + out_degree > 20) AS god_components,
+                         (SELECT COUNT(*) FROM graph_metrics
+                          WHERE betweenness > 0.1) AS bottlenecks"""
+                ).fetchone()
+            self._counts = {
+                "dead_exports": row["dead_exports"],
+                "god_components": row["god_components"],
+                "bottlenecks": row["bottlenecks"],
+            }
+        return self._counts
+
+    def get_top_complexity(self, conn):
+        """Top-50 symbols by cognitive complexity, fetched once per run.
+
+        Rows above any rule's threshold are a prefix of this descending
+        list and each rule reports at most 50, so the shared top-50 is
+        sufficient for every complexity rule in the run.
+        """
+        with self._lock:
+            if self._top_complexity is None:
+                self._top_complexity = conn.execute(
+                    """SELECT sm.cognitive_complexity, s.name, s.kind,
+                              s.line_start, f.path
+                       FROM symbol_metrics sm
+                       JOIN symbols s ON sm.symbol_id = s.id
+                       JOIN files f ON s.file_id = f.id
+                       ORDER BY sm.cognitive_complexity DESC
+                       LIMIT 50"""
+                ).fetchall()
+            return self._top_complexity
+
+    def get_symbols_of_kind(self, conn, kind):
+        """Symbol rows for one kind, fetched once per run.
+
+        Several naming rules usually target the same kind; each regex
+        is then evaluated over the shared rows instead of re-querying.
+        """
+        with self._lock:
+            if kind not in self._symbols_by_kind:
+                self._symbols_by_kind[kind] = conn.execute(
+                    """SELECT s.name, s.kind, s.line_start, f.path
+                       FROM symbols s
+                       JOIN files f ON s.file_id = f.id
+                       WHERE s.kind = ?""",
+                    (kind,),
+                ).fetchall()
+            return self._symbols_by_kind[kind]
+
+
+def _iter_dependency_violations(rule, conn, ctx):
+    """Yield violations for one dependency rule lazily.
+
+    Rows stream straight from the cursor (or the cached join) and
+    violation dicts are only built on demand, so the caller controls
+    how many are materialised via islice.
     """
     from_pattern = rule.get("from", "**")
     to_pattern = rule.get("to", "**")
     allow = rule.get("allow", False)
+    if allow:
+        return
 
-    # Get all edges with file paths
-    rows = conn.execute(
-        """SELECT e.source_id, e.target_id, e.kind, e.line,
-                  sf.path as source_path, tf.path as target_path,
-                  ss.name as source_name, ts.name as target_name
-           FROM edges e
-           JOIN symbols ss ON e.source_id = ss.id
-           JOIN symbols ts ON e.target_id = ts.id
-           JOIN files sf ON ss.file_id = sf.id
-           JOIN files tf ON ts.file_id = tf.id"""
-    ).fetchall()
+    # Precompile the globs once per rule instead of fnmatch per row
+    from_re = _compile_glob(from_pattern)
+    to_re = _compile_glob(to_pattern)
+
+    rows = None
+    first_seg = from_pattern.split("/", 1)[0]
+    if (
+        ctx._dep_rows is not None
+        and "/" in from_pattern
+        and not any(c in first_seg for c in "*?[")
+    ):
+        # Full join already cached: prune by leading directory segment
+        dep_rows = ctx.get_dep_rows(conn)
+        rows = (dep_rows[i] for i in ctx.get_dep_dir_index(conn).get(first_seg, ()))
+    if rows is None:
+        rows = ctx.get_dep_rows_filtered(conn, from_pattern, to_pattern)
 
-    violations = []
     for r in rows:
-        src_match = fnmatch.fnmatch(r["source_path"], from_pattern)
-        tgt_match = fnmatch.fnmatch(r["target_path"], to_pattern)
-
-        if src_match and tgt_match and not allow:
-            violations.append({
+        if from_re.match(r["source_path"]) and to_re.match(r["target_path"]):
+            yield {
                 "rule": rule["name"],
                 "type": "dependency",
                 "message": f"{r['source_name']} -> {r['target_name']}",
                 "source": f"{r['source_path']}:{r['line'] or '?'}",
                 "target": r["target_path"],
                 "edge_kind": r["kind"],
-            })
+            }
 
-    return violations
 
+def _check_dependency_rule(rule, conn, ctx=None, cap=None) -> list[dict]:
+    """Check a dependency constraint rule.
 
-def _check_metric_rule(rule, conn) -> list[dict]:
+    Verifies that symbols in 'from' glob don't have edges to symbols
+    in 'to' glob (or vice versa if allow=true).
+    """
+    if ctx is None:
+        ctx = _RunContext()
+    return list(islice(_iter_dependency_violations(rule, conn, ctx), cap))
+
+
+def _check_metric_rule(rule, conn, ctx=None, cap=None) -> list[dict]:
     """Check a metric threshold rule."""
+    if ctx is None:
+        ctx = _RunContext()
     metric = rule.get("metric", "")
     max_val = rule.get("max")
     min_val = rule.get("min")
@@ -181,10 +424,14 @@ def _check_metric_rule(rule, conn) -> list[dict]:
     # Global metrics (from health-style computation)
     if metric == "cycles":
         try:
-            from roam.graph.builder import build_symbol_graph
-            from roam.graph.cycles import find_cycles
-            G = build_symbol_graph(conn)
-            cycles = find_cycles(G)
+            if max_val == 0 and min_val is None and ctx._cycles is None:
+                # Only a boolean is needed: early-exit SCC scan over the
+                # plain adjacency dict — no networkx graph at all.  The
+                # full list is only enumerated to report the count.
+                from roam.graph.cycles import has_cycle_adj
+                if not has_cycle_adj(ctx.get_adjacency(conn)):
+                    return violations
+            cycles = ctx.get_cycles(conn)
             count = len(cycles)
             if max_val is not None and count > max_val:
                 violations.append({
@@ -210,15 +457,15 @@ def _check_metric_rule(rule, conn) -> list[dict]:
     elif metric == "health_score":
         # Compute health score inline
         try:
-            from roam.graph.builder import build_symbol_graph
-            from roam.graph.cycles import find_cycles
-            G = build_symbol_graph(conn)
-            total_syms = len(G)
+            total_syms = conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
             if total_syms == 0:
                 return []
 
-            cycles = find_cycles(G)
-            cycle_syms = sum(len(c) for c in cycles)
+            if ctx._cycles is not None:
+                cycle_syms = sum(len(c) for c in ctx._cycles)
+            else:
+                from roam.graph.cycles import cycle_node_set_adj
+                cycle_syms = len(cycle_node_set_adj(ctx.get_adjacency(conn)))
             cycle_pct = (cycle_syms / total_syms * 100) if total_syms else 0
 
             score = max(0, 100 - int(cycle_pct * 2))
@@ -242,17 +489,10 @@ def _check_metric_rule(rule, conn) -> list[dict]:
         # Per-symbol metric check
         try:
             threshold = max_val if max_val is not None else 999
-            rows = conn.execute(
-                """SELECT sm.cognitive_complexity, s.name, s.kind,
-                          s.line_start, f.path
-                   FROM symbol_metrics sm
-                   JOIN symbols s ON sm.symbol_id = s.id
-                   JOIN files f ON s.file_id = f.id
-                   WHERE sm.cognitive_complexity > ?
-                   ORDER BY sm.cognitive_complexity DESC
-                   LIMIT 50""",
-                (threshold,),
-            ).fetchall()
+            rows = [
+                r for r in ctx.get_top_complexity(conn)
+                if r["cognitive_complexity"] > threshold
+            ]
             for r in rows:
                 violations.append({
                     "rule": rule["name"], "type": "metric",
@@ -270,34 +510,21 @@ def _check_metric_rule(rule, conn) -> list[dict]:
 
     elif metric in ("god_components", "bottlenecks", "dead_exports", "layer_violations"):
         # These require more complex computation — delegate to simplified checks
-        _check_count_metric(metric, rule, conn, violations)
+        _check_count_metric(metric, rule, conn, violations, ctx)
 
     return violations
 
 
-def _check_count_metric(metric, rule, conn, violations):
+def _check_count_metric(metric, rule, conn, violations, ctx=None):
     """Check count-based metrics."""
     max_val = rule.get("max")
     min_val = rule.get("min")
 
-    if metric == "dead_exports":
-        count = conn.execute(
-            """SELECT COUNT(*) FROM symbols s
-               LEFT JOIN graph_metrics gm ON s.id = gm.symbol_id
-               WHERE s.is_exported = 1
-               AND (gm.in_degree IS NULL OR gm.in_degree = 0)"""
-        ).fetchone()[0]
-    elif metric == "god_components":
-        rows = conn.execute(
-            "SELECT COUNT(*) FROM graph_metrics WHERE in_degree + out_degree > 20"
-        ).fetchone()
-        count = rows[0] if rows else 0
-    elif metric == "bottlenecks":
-        count = conn.execute(
-            "SELECT COUNT(*) FROM graph_metrics WHERE betweenness > 0.1"
-        ).fetchone()[0]
-    else:
+    if metric not in ("dead_exports", "god_components", "bottlenecks"):
         return
+    if ctx is None:
+        ctx = _RunContext()
+    count = ctx.get_counts(conn)[metric]
 
     if max_val is not None and count > max_val:
         violations.append({
@@ -313,7 +540,7 @@ def _check_count_metric(metric, rule, conn, violations):
         })
 
 
-def _check_naming_rule(rule, conn) -> list[dict]:
+def _check_naming_rule(rule, conn, ctx=None, cap=None) -> list[dict]:
     """Check a naming convention rule."""
     kind = rule.get("kind", "function")
     pattern = rule.get("pattern", "")
@@ -322,19 +549,14 @@ def _check_naming_rule(rule, conn) -> list[dict]:
     if not pattern:
         return []
 
-    regex = re.compile(pattern)
-    exclude_re = re.compile(exclude) if exclude else None
-
-    rows = conn.execute(
-        """SELECT s.name, s.kind, s.line_start, f.path
-           FROM symbols s
-           JOIN files f ON s.file_id = f.id
-           WHERE s.kind = ?""",
-        (kind,),
-    ).fetchall()
+    if ctx is None:
+        ctx = _RunContext()
+    regex, exclude_re = _compile_rule(pattern, exclude)
 
     violations = []
-    for r in rows:
+    for r in ctx.get_symbols_of_kind(conn, kind):
+        if cap is not None and len(violations) >= cap:
+            break
         name = r["name"]
         if exclude_re and exclude_re.match(name):
             continue
@@ -349,7 +571,7 @@ def _check_naming_rule(rule, conn) -> list[dict]:
     return violations
 
 
-def _check_trend_rule(rule, conn) -> list[dict]:
+def _check_trend_rule(rule, conn, ctx=None, cap=None) -> list[dict]:
     """Check a trend-based regression guard.
 
     Compares the latest snapshot metric value against recent history
@@ -446,6 +668,69 @@ _CHECKERS = {
 }
 
 
+def _evaluate_rules(rules, conn, cap=None):
+    """Evaluate all rules and return (rule_results, all_violations).
+
+    *cap*, when set, bounds the violations collected per rule; capped
+    rule results carry ``truncated: True`` so consumers know the count
+    is clipped.
+
+    Rules run on a small thread pool when there are several: workers
+    share one connection (the caller opens it with
+    ``check_same_thread=False``), SQLite serialises access internally,
+    and the run-context lock prevents duplicate cache builds.  Results
+    merge back in rule order regardless of completion order.
+    """
+    run_ctx = _RunContext()
+
+    # Precheck which shared caches this rule set actually needs.  The
+    # adjacency dict is only built when a cycles/health_score rule is
+    # present; the full edge join is only prefetched when several
+    # dependency rules will share it, otherwise each rule's
+    # SQL-filtered query is cheaper.
+    metrics = {r.get("metric") for r in rules if r.get("type") == "metric"}
+    if metrics & {"cycles", "health_score"}:
+        run_ctx.get_adjacency(conn)
+    if sum(1 for r in rules if r.get("type") == "dependency") > 1:
+        run_ctx.get_dep_rows(conn)
+
+    def _run_one(rule):
+        checker = _CHECKERS.get(rule.get("type", ""))
+        if checker is None:
+            return None
+        return checker(rule, conn, run_ctx, cap)
+
+    if len(rules) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(rules))) as pool:
+            outcomes = list(pool.map(_run_one, rules))
+    else:
+        outcomes = [_run_one(rule) for rule in rules]
+
+    rule_results = []
+    all_violations = []
+    for rule, violations in zip(rules, outcomes):
+        if violations is None:
+            continue  # Unknown rule type
+        result_entry = {
+            "name": rule.get("name", "unnamed"),
+            "type": rule.get("type", ""),
+            "status": "PASS" if not violations else "FAIL",
+            "violations": len(violations),
+        }
+        if cap is not None and len(violations) >= cap:
+            result_entry["truncated"] = True
+        reason = rule.get("reason", "")
+        link = rule.get("link", "")
+        if reason:
+            result_entry["reason"] = reason
+        if link:
+            result_entry["link"] = link
+        rule_results.append(result_entry)
+        all_violations.extend(violations)
+
+    return rule_results, all_violations
+
+
 # ── CLI command ──────────────────────────────────────────────────────
 
 @click.command("fitness")
@@ -490,32 +775,14 @@ def fitness(ctx, do_init, rule_filter, explain):
             click.echo(f"No rules matching '{rule_filter}'.")
             return
 
-    with open_db(readonly=True) as conn:
-        all_violations = []
-        rule_results = []
-
-        for rule in rules:
-            rtype = rule.get("type", "")
-            checker = _CHECKERS.get(rtype)
-            if checker is None:
-                continue
-
-            violations = checker(rule, conn)
-            status = "PASS" if not violations else "FAIL"
-            reason = rule.get("reason", "")
-            link = rule.get("link", "")
-            result_entry = {
-                "name": rule.get("name", "unnamed"),
-                "type": rtype,
-                "status": status,
-                "violations": len(violations),
-            }
-            if reason:
-                result_entry["reason"] = reason
-            if link:
-                result_entry["link"] = link
-            rule_results.append(result_entry)
-            all_violations.extend(violations)
+    # Dedicated connection so rule checks may run on worker threads
+    conn = get_connection(get_db_path(), readonly=True, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA query_only=ON")
+        # Cap per-rule collection only for filtered runs; full runs
+        # report exact counts
+        cap = MAX_VIOLATIONS_PER_RULE if rule_filter else None
+        rule_results, all_violations = _evaluate_rules(rules, conn, cap=cap)
 
         passed = sum(1 for r in rule_results if r["status"] == "PASS")
         failed = sum(1 for r in rule_results if r["status"] == "FAIL")
@@ -571,6 +838,8 @@ def fitness(ctx, do_init, rule_filter, explain):
 
         if failed > 0:
             raise SystemExit(1)
+    finally:
+        conn.close()
 
 
 def _init_config(root: Path):
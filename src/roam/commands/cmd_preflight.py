@@ -27,7 +27,7 @@ from roam.commands.cmd_conventions import (
     classify_case,
     _group_for_kind,
 )
-from roam.commands.cmd_fitness import _load_rules, _CHECKERS
+from roam.commands.cmd_fitness import _load_rules, _CHECKERS, _RunContext
 
 
 # ---------------------------------------------------------------------------
@@ -405,6 +405,7 @@ def _check_fitness(conn, root):
 
     all_violations = []
     rule_results = []
+    run_ctx = _RunContext()
 
     for rule in rules:
         rtype = rule.get("type", "")
@@ -413,7 +414,7 @@ def _check_fitness(conn, root):
             continue
 
         try:
-            violations = checker(rule, conn)
+            violations = checker(rule, conn, run_ctx)
         except Exception:
             violations = []
 
@@ -7,7 +7,7 @@ import json as _json
 import click
 
 from roam.output.formatter import to_json, json_envelope
-from roam.output.schema_registry import get_schema_info, validate_envelope
+from roam.output.schema_registry import get_schema_info_mutable, validate_envelope
 
 
 @click.command("schema")
@@ -19,7 +19,8 @@ from roam.output.schema_registry import get_schema_info, validate_envelope
 def schema_cmd(ctx, validate_file, show_changelog):
     """Show the roam JSON envelope schema and validate output files."""
     json_mode = ctx.obj.get("json") if ctx.obj else False
-    schema = get_schema_info()
+    # Mutable copy: the JSON modes serialize the schema wholesale
+    schema = get_schema_info_mutable()
 
     # --validate FILE mode
     if validate_file:
@@ -97,7 +97,11 @@ def _is_cloud_synced(path: Path) -> bool:
     return any(m in resolved for m in markers)
 
 
-def get_connection(db_path: Path | None = None, readonly: bool = False) -> sqlite3.Connection:
+def get_connection(
+    db_path: Path | None = None,
+    readonly: bool = False,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
     """Get a SQLite connection with optimized settings."""
     if db_path is None:
         db_path = get_db_path()
@@ -110,11 +114,17 @@ def get_connection(db_path: Path | None = None, readonly: bool = False) -> sqlit
         # plain connection when the path cannot be expressed as a URI.
         try:
             uri = db_path.as_uri() + "?mode=ro"
-            conn = sqlite3.connect(uri, uri=True, timeout=30)
+            conn = sqlite3.connect(
+                uri, uri=True, timeout=30, check_same_thread=check_same_thread
+            )
         except (sqlite3.OperationalError, ValueError):
-            conn = sqlite3.connect(str(db_path), timeout=30)
+            conn = sqlite3.connect(
+                str(db_path), timeout=30, check_same_thread=check_same_thread
+            )
     else:
-        conn = sqlite3.connect(str(db_path), timeout=30)
+        conn = sqlite3.connect(
+            str(db_path), timeout=30, check_same_thread=check_same_thread
+        )
 
     conn.row_factory = sqlite3.Row
     cloud = _is_cloud_synced(db_path)
@@ -166,6 +176,30 @@ def ensure_schema(conn: sqlite3.Connection):
     # Cross-language bridge metadata on edges
     _safe_alter(conn, "edges", "bridge", "TEXT")
     _safe_alter(conn, "edges", "confidence", "REAL")
+    # v10: reversed path column so suffix lookups become indexed prefix scans
+    _safe_alter(conn, "files", "path_reversed", "TEXT")
+    stale = conn.execute(
+        "SELECT id, path FROM files WHERE path_reversed IS NULL"
+    ).fetchall()
+    if stale:
+        conn.executemany(
+            "UPDATE files SET path_reversed = ? WHERE id = ?",
+            [(row[1][::-1], row[0]) for row in stale],
+        )
+    # v10: precomputed dead-export flag so count checks skip the
+    # graph_metrics join; maintained by the indexer after metrics are stored
+    _safe_alter(conn, "symbols", "is_dead_export", "INTEGER")
+    conn.execute(
+        "UPDATE symbols SET is_dead_export = CASE "
+        "WHEN is_exported = 1 AND NOT EXISTS ("
+        "SELECT 1 FROM graph_metrics gm "
+        "WHERE gm.symbol_id = symbols.id AND gm.in_degree > 0) "
+        "THEN 1 ELSE 0 END "
+        "WHERE is_dead_export IS NULL"
+    )
+    # Supersedes the earlier partial index on is_exported, which could
+    # not serve the dead-export count
+    conn.execute("DROP INDEX IF EXISTS idx_symbols_exported")
     # v9.0: runtime_stats table — CREATE TABLE IF NOT EXISTS in SCHEMA_SQL handles it
     # Migration: ensure table exists for databases created before this version
     conn.execute(
@@ -203,6 +237,14 @@ def ensure_schema(conn: sqlite3.Connection):
     # TF-IDF semantic search table — recreate with ON DELETE CASCADE if missing
     # Drop and recreate to ensure proper FK constraint (data is recomputed on index)
     _ensure_tfidf_cascade(conn)
+    # Pre-normalized vector flag + persisted L2 norm on tables created
+    # before normalization
+    _safe_alter(conn, "symbol_tfidf", "normalized", "INTEGER DEFAULT 0")
+    _safe_alter(conn, "symbol_tfidf", "norm", "REAL DEFAULT 1.0")
+    # Hybrid BM25 scoring: per-term document frequency + per-posting
+    # BM25 weight (both recomputed on every index)
+    _safe_alter(conn, "tfidf_terms", "df", "INTEGER DEFAULT 0")
+    _safe_alter(conn, "tfidf_postings", "bm25", "REAL DEFAULT 0.0")
 
 
 def _ensure_tfidf_cascade(conn: sqlite3.Connection):
@@ -223,6 +265,8 @@ def _ensure_tfidf_cascade(conn: sqlite3.Connection):
         "CREATE TABLE IF NOT EXISTS symbol_tfidf ("
         "symbol_id INTEGER PRIMARY KEY REFERENCES symbols(id) ON DELETE CASCADE, "
         "terms TEXT NOT NULL, "
+        "normalized INTEGER DEFAULT 0, "
+        "norm REAL DEFAULT 1.0, "
         "updated_at TEXT DEFAULT (datetime('now'))"
         ")"
     )
@@ -302,10 +346,47 @@ def db_exists(project_root: Path | None = None) -> bool:
     return path.exists() and path.stat().st_size > 0
 
 
+# ---------------------------------------------------------------------------
+# Persistent read-only connection cache — opt-in for long-lived hosts
+# ---------------------------------------------------------------------------
+
+_readonly_cache: dict[str, sqlite3.Connection] = {}
+_readonly_cache_enabled = False
+
+
+def enable_readonly_cache():
+    """Keep read-only connections open for the life of the process.
+
+    Long-lived hosts (e.g. the MCP server) dispatch many commands
+    in-process; reopening the database and re-applying pragmas on every
+    command is wasted work.  Cached connections are created with
+    ``check_same_thread=False`` so the host may call from worker threads.
+    Write connections are unaffected and still open/close per use.
+    """
+    global _readonly_cache_enabled
+    _readonly_cache_enabled = True
+
+
 @contextmanager
 def open_db(readonly: bool = False, project_root: Path | None = None):
     """Context manager for database access. Creates schema if needed."""
     db_path = get_db_path(project_root)
+
+    if readonly and _readonly_cache_enabled:
+        key = str(db_path)
+        conn = _readonly_cache.get(key)
+        if conn is None:
+            conn = get_connection(db_path, readonly=True, check_same_thread=False)
+            _readonly_cache[key] = conn
+        try:
+            yield conn
+        except sqlite3.ProgrammingError:
+            # Connection was closed out from under us; drop it so the
+            # next call reopens cleanly.
+            _readonly_cache.pop(key, None)
+            raise
+        return
+
     conn = get_connection(db_path, readonly=readonly)
     try:
         if not readonly:
@@ -4,6 +4,7 @@ SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS files (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     path TEXT NOT NULL UNIQUE,
+    path_reversed TEXT,
     language TEXT,
     file_role TEXT DEFAULT 'source',
     hash TEXT,
@@ -23,6 +24,7 @@ CREATE TABLE IF NOT EXISTS symbols (
     docstring TEXT,
     visibility TEXT DEFAULT 'public',
     is_exported INTEGER DEFAULT 1,
+    is_dead_export INTEGER DEFAULT 0,
     parent_id INTEGER REFERENCES symbols(id) ON DELETE SET NULL,
     default_value TEXT
 );
@@ -98,6 +100,8 @@ CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols(file_id);
 CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
 CREATE INDEX IF NOT EXISTS idx_symbols_qualified ON symbols(qualified_name);
 CREATE INDEX IF NOT EXISTS idx_symbols_kind ON symbols(kind);
+CREATE INDEX IF NOT EXISTS idx_symbols_kind_file ON symbols(kind, file_id, name, line_start);
+CREATE INDEX IF NOT EXISTS idx_symbols_dead_export ON symbols(file_id) WHERE is_dead_export = 1;
 CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id);
 CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id);
 CREATE INDEX IF NOT EXISTS idx_edges_kind ON edges(kind);
@@ -106,9 +110,11 @@ CREATE INDEX IF NOT EXISTS idx_file_edges_target ON file_edges(target_file_id);
 CREATE INDEX IF NOT EXISTS idx_git_changes_file ON git_file_changes(file_id);
 CREATE INDEX IF NOT EXISTS idx_git_changes_commit ON git_file_changes(commit_id);
 CREATE INDEX IF NOT EXISTS idx_files_path ON files(path);
+CREATE INDEX IF NOT EXISTS idx_files_path_rev ON files(path_reversed);
 CREATE INDEX IF NOT EXISTS idx_graph_metrics_pagerank ON graph_metrics(pagerank DESC);
 CREATE INDEX IF NOT EXISTS idx_symbols_parent ON symbols(parent_id);
 CREATE INDEX IF NOT EXISTS idx_edges_kind_target ON edges(kind, target_id);
+CREATE INDEX IF NOT EXISTS idx_edges_src_tgt ON edges(source_id, target_id);
 CREATE INDEX IF NOT EXISTS idx_file_stats_churn ON file_stats(total_churn DESC);
 
 -- Hypergraph: n-ary commit patterns (beyond pairwise co-change)
@@ -255,6 +261,24 @@ CREATE INDEX IF NOT EXISTS idx_vuln_symbol ON vulnerabilities(matched_symbol_id)
 CREATE TABLE IF NOT EXISTS symbol_tfidf (
     symbol_id INTEGER PRIMARY KEY REFERENCES symbols(id) ON DELETE CASCADE,
     terms TEXT NOT NULL,
+    normalized INTEGER DEFAULT 0,
+    norm REAL DEFAULT 1.0,
     updated_at TEXT DEFAULT (datetime('now'))
 );
+
+-- Inverted index over TF-IDF terms (semantic search pruning)
+CREATE TABLE IF NOT EXISTS tfidf_terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    df INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS tfidf_postings (
+    term_id INTEGER NOT NULL REFERENCES tfidf_terms(id) ON DELETE CASCADE,
+    symbol_id INTEGER NOT NULL REFERENCES symbols(id) ON DELETE CASCADE,
+    weight REAL NOT NULL,
+    bm25 REAL DEFAULT 0.0
+);
+
+CREATE INDEX IF NOT EXISTS idx_tfidf_postings_term ON tfidf_postings(term_id);
 """
@@ -57,6 +57,119 @@ def find_cycles(G: nx.DiGraph, min_size: int = 2) -> list[list[int]]:
     return sccs
 
 
+def build_adjacency(conn: sqlite3.Connection) -> dict[int, list[int]]:
+    """Plain adjacency list built straight from the edges table.
+
+    A lightweight alternative to ``build_symbol_graph`` when only
+    SCC/degree questions need answering: one pass over edges, no node
+    attributes, no networkx objects.  Edges referencing unknown symbol
+    ids are skipped, matching the full graph builder.
+    """
+    sym_ids = {r[0] for r in conn.execute("SELECT id FROM symbols")}
+    adj: dict[int, list[int]] = {}
+    for source_id, target_id in conn.execute(
+        "SELECT source_id, target_id FROM edges"
+    ):
+        if source_id in sym_ids and target_id in sym_ids:
+            adj.setdefault(source_id, []).append(target_id)
+    return adj
+
+
+def _iter_sccs(adj: dict[int, list[int]]):
+    """Yield strongly connected components of a plain adjacency dict.
+
+    Iterative Tarjan — no recursion limit issues on deep call chains,
+    and no graph object construction.
+    """
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    counter = 0
+
+    for root in adj:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adj.get(root, ())))]
+
+        while work:
+            node, it = work[-1]
+            advanced = False
+            for nxt in it:
+                if nxt not in index:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(adj.get(nxt, ()))))
+                    advanced = True
+                    break
+                if nxt in on_stack and index[nxt] < low[node]:
+                    low[node] = index[nxt]
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                comp = set()
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    comp.add(member)
+                    if member == node:
+                        break
+                yield comp
+
+
+def has_cycle_adj(adj: dict[int, list[int]]) -> bool:
+    """Adjacency-dict counterpart of :func:`has_cycle`."""
+    return any(len(c) >= 2 for c in _iter_sccs(adj))
+
+
+def cycle_node_set_adj(adj: dict[int, list[int]]) -> set[int]:
+    """Adjacency-dict counterpart of :func:`cycle_node_set`."""
+    nodes: set[int] = set()
+    for c in _iter_sccs(adj):
+        if len(c) >= 2:
+            nodes.update(c)
+    return nodes
+
+
+def has_cycle(G: nx.DiGraph) -> bool:
+    """Return True as soon as any SCC with >= 2 members is found.
+
+    Cheaper than :func:`find_cycles` when the caller only needs a
+    boolean (e.g. a ``cycles max: 0`` fitness rule): the SCC generator
+    stops at the first multi-member component instead of materialising
+    and sorting the full list.
+    """
+    if len(G) == 0:
+        return False
+    return any(len(c) >= 2 for c in nx.strongly_connected_components(G))
+
+
+def cycle_node_set(G: nx.DiGraph) -> set[int]:
+    """Return the set of nodes that participate in any cycle.
+
+    Union of all SCCs with >= 2 members, without the per-component
+    sorting that :func:`find_cycles` does for display purposes.
+    """
+    nodes: set[int] = set()
+    if len(G) == 0:
+        return nodes
+    for c in nx.strongly_connected_components(G):
+        if len(c) >= 2:
+            nodes.update(c)
+    return nodes
+
+
 def format_cycles(
     cycles: list[list[int]], conn: sqlite3.Connection
 ) -> list[dict]:
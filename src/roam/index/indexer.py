@@ -555,8 +555,8 @@ class Indexer:
             file_role = classify_file(rel_path, content_head)
 
             conn.execute(
-                "INSERT INTO files (path, language, file_role, hash, mtime, line_count) VALUES (?, ?, ?, ?, ?, ?)",
-                (rel_path, language, file_role, fhash, mtime, line_count),
+                "INSERT INTO files (path, path_reversed, language, file_role, hash, mtime, line_count) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (rel_path, rel_path[::-1], language, file_role, fhash, mtime, line_count),
             )
             row = conn.execute("SELECT last_insert_rowid()").fetchone()
             if not row:
@@ -757,6 +757,7 @@ class Indexer:
                         ph = ",".join("?" for _ in sym_ids)
                         for cleanup_sql in [
                             f"DELETE FROM symbol_tfidf WHERE symbol_id IN ({ph})",
+                            f"DELETE FROM tfidf_postings WHERE symbol_id IN ({ph})",
                             f"UPDATE runtime_stats SET symbol_id = NULL WHERE symbol_id IN ({ph})",
                             f"UPDATE vulnerabilities SET matched_symbol_id = NULL WHERE matched_symbol_id IN ({ph})",
                         ]:
@@ -845,6 +846,19 @@ class Indexer:
             else:
                 _log("Skipping graph metrics (module not available)")
 
+            # Dead-export flag — precomputed so count checks (fitness,
+            # health) are a plain partial-index scan instead of a join
+            try:
+                conn.execute(
+                    "UPDATE symbols SET is_dead_export = CASE "
+                    "WHEN is_exported = 1 AND NOT EXISTS ("
+                    "SELECT 1 FROM graph_metrics gm "
+                    "WHERE gm.symbol_id = symbols.id AND gm.in_degree > 0) "
+                    "THEN 1 ELSE 0 END"
+                )
+            except Exception as e:
+                _log(f"  Dead-export flagging failed: {e}")
+
             # Git history
             analyze_git = _try_import_git_stats()
             if analyze_git is not None:
@@ -923,6 +937,13 @@ class Indexer:
             except Exception as e:
                 _log(f"  TF-IDF build failed (non-fatal): {e}")
 
+            # Refresh planner statistics so the query optimizer picks the
+            # composite indexes for the hot join-heavy commands.
+            try:
+                conn.execute("ANALYZE")
+            except Exception:
+                pass
+
             from roam.index.parser import get_parse_error_summary
             error_summary = get_parse_error_summary()
             if error_summary:
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 
 try:
     from fastmcp import FastMCP
@@ -24,6 +24,31 @@ except ImportError:
         "Install it with:  pip install fastmcp"
     )
 
+# orjson is optional; it parses and serialises large JSON payloads
+# several times faster than the stdlib. Fall back silently if absent.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+from roam.db.connection import enable_readonly_cache
+
+# The server dispatches commands in-process; keep read-only DB
+# connections open across tool calls instead of reopening per call.
+enable_readonly_cache()
+
 # ---------------------------------------------------------------------------
 # Lite mode: expose only ~15 core tools when ROAM_MCP_LITE=1
 # ---------------------------------------------------------------------------
@@ -65,43 +90,85 @@ mcp = FastMCP(
 # Internal helper
 # ---------------------------------------------------------------------------
 
+# Per-call wall-clock bound, matching the old subprocess timeout
+_TOOL_TIMEOUT_S = 60
+
+# All tool calls funnel through one worker thread: the CliRunner
+# dispatch below chdirs the whole process, so concurrent calls with
+# different roots would otherwise race on the global cwd and query the
+# wrong project's DB.  The thread is only spawned on first use.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
 def _run_roam(args: list[str], root: str = ".") -> dict:
-    """Run a roam CLI command with ``--json`` and return parsed output.
+    """Invoke a roam CLI command in-process with ``--json`` and return parsed output.
+
+    Dispatches through Click's ``CliRunner`` instead of spawning a
+    ``roam`` subprocess: the server process keeps its warm imports and
+    caches, and each tool call skips interpreter + CLI startup (~300ms).
+    Calls are serialized on one worker thread and bounded to
+    ``_TOOL_TIMEOUT_S`` seconds; a hung command makes later calls time
+    out cleanly instead of hanging the server.
 
     Parameters
     ----------
     args:
         Arguments to pass after ``roam --json``, e.g. ``["health"]``.
     root:
-        Working directory for the subprocess (the project root).
+        Working directory for the command (the project root).
 
     Returns
     -------
     dict
-        Parsed JSON from stdout on success, or an ``{"error": ...}`` dict
-        on failure / timeout.
+        Parsed JSON from the command's stdout on success, or an
+        ``{"error": ...}`` dict on failure.
     """
-    cmd = ["roam", "--json"] + args
+    future = _EXECUTOR.submit(_invoke_cli, args, root)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=root,
-            timeout=60,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout)
-        return {
-            "error": result.stderr.strip() or "Command failed",
-            "exit_code": result.returncode,
-        }
-    except subprocess.TimeoutExpired:
-        return {"error": "Command timed out after 60s"}
-    except json.JSONDecodeError as exc:
-        return {"error": f"Failed to parse JSON output: {exc}"}
+        return future.result(timeout=_TOOL_TIMEOUT_S)
+    except FuturesTimeout:
+        return {"error": f"Command timed out after {_TOOL_TIMEOUT_S}s"}
+
+
+def _invoke_cli(args: list[str], root: str) -> dict:
+    """Worker-thread body of :func:`_run_roam` (chdir + CliRunner)."""
+    from click.testing import CliRunner
+
+    from roam.cli import cli
+    from roam.output.formatter import set_capture_hook
+
+    prev_cwd = os.getcwd()
+    captured: list[dict] = []
+    try:
+        os.chdir(root)
+        set_capture_hook(captured.append)
+        try:
+            result = CliRunner().invoke(cli, ["--json"] + args)
+        finally:
+            set_capture_hook(None)
+        if captured:
+            # Envelope captured before serialisation — no re-parse needed
+            return captured[-1]
+        out = getattr(result, "stdout", None) or result.output or ""
+        if out.strip():
+            try:
+                return _loads(out)
+            except ValueError as exc:
+                if result.exit_code != 0:
+                    return {
+                        "error": out.strip() or "Command failed",
+                        "exit_code": result.exit_code,
+                    }
+                return {"error": f"Failed to parse JSON output: {exc}"}
+        if result.exception is not None and not isinstance(
+            result.exception, SystemExit
+        ):
+            return {"error": str(result.exception)}
+        return {"error": "Command failed", "exit_code": result.exit_code}
     except Exception as exc:
         return {"error": str(exc)}
+    finally:
+        os.chdir(prev_cwd)
 
 
 # ===================================================================
@@ -676,6 +743,30 @@ def get_annotations(
 # MCP Resources -- static/cached summaries available at fixed URIs
 # ===================================================================
 
+# Pre-serialised resource payloads keyed by command, validated against
+# the index DB's mtime: resources are polled far more often than the
+# index changes, so recomputing health/understand per poll is wasted.
+_resource_cache: dict[str, tuple[float, str]] = {}
+
+
+def _cached_resource(command: str) -> str:
+    """Return the serialised payload for *command*, recomputing only
+    when the index database has changed since the cached run."""
+    from roam.db.connection import get_db_path
+
+    try:
+        mtime = os.path.getmtime(get_db_path())
+    except OSError:
+        mtime = -1.0
+
+    hit = _resource_cache.get(command)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+
+    payload = _dumps(_run_roam([command]))
+    _resource_cache[command] = (mtime, payload)
+    return payload
+
 
 @mcp.resource("roam://health")
 def get_health_resource() -> str:
@@ -684,8 +775,7 @@ def get_health_resource() -> str:
     Provides the same data as the ``health`` tool but exposed as an
     MCP resource so agents can subscribe to or poll it.
     """
-    data = _run_roam(["health"])
-    return json.dumps(data, indent=2)
+    return _cached_resource("health")
 
 
 @mcp.resource("roam://summary")
@@ -695,8 +785,7 @@ def get_summary_resource() -> str:
     Equivalent to calling the ``understand`` tool, exposed as a
     resource for agents that prefer resource-based access.
     """
-    data = _run_roam(["understand"])
-    return json.dumps(data, indent=2)
+    return _cached_resource("understand")
 
 
 # ===================================================================
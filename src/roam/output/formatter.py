@@ -110,8 +110,22 @@ def format_table(headers: list[str], rows: list[list[str]],
     return "\n".join(lines)
 
 
+# In-process hosts (the MCP server) can register a hook here to receive
+# the envelope dict directly, skipping the serialise -> re-parse round
+# trip on large payloads.  None in normal CLI use.
+_capture_hook = None
+
+
+def set_capture_hook(hook):
+    """Register *hook* (or None) to receive every dict passed to to_json."""
+    global _capture_hook
+    _capture_hook = hook
+
+
 def to_json(data) -> str:
     """Serialize data to a JSON string."""
+    if _capture_hook is not None and isinstance(data, dict):
+        _capture_hook(data)
     return _json.dumps(data, indent=2, default=str)
 
 
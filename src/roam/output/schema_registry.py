@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+import types
+
 ENVELOPE_SCHEMA = {
     "name": "roam-envelope-v1",
     "version": "1.0.0",
@@ -23,9 +26,27 @@ ENVELOPE_SCHEMA = {
 }
 
 
+# Read-only view shared by all get_schema_info callers — the schema is
+# a constant, so handing out one proxy beats copying the nested dict on
+# every envelope emission
+_FROZEN_SCHEMA = types.MappingProxyType(ENVELOPE_SCHEMA)
+
+
 def get_schema_info() -> dict:
-    """Return the current schema definition."""
-    return ENVELOPE_SCHEMA.copy()
+    """Return the current schema definition (read-only shared view)."""
+    return _FROZEN_SCHEMA
+
+
+def get_schema_info_mutable() -> dict:
+    """Return a mutable copy of the schema, for callers that modify or
+    serialize it as a plain dict."""
+    return dict(ENVELOPE_SCHEMA)
+
+
+# Hoisted so the per-envelope hot path is one C-level set difference and
+# one precompiled regex match instead of N dict probes and a str.split
+_REQUIRED = frozenset(ENVELOPE_SCHEMA["required_fields"])
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
 
 
 def validate_envelope(data: dict) -> tuple[bool, list[str]]:
@@ -33,17 +54,13 @@ def validate_envelope(data: dict) -> tuple[bool, list[str]]:
 
     Returns (is_valid, list_of_errors).
     """
-    errors = []
-    for field in ENVELOPE_SCHEMA["required_fields"]:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
+    missing = _REQUIRED.difference(data)
+    errors = [f"Missing required field: {f}" for f in sorted(missing)]
 
     if "summary" in data and not isinstance(data["summary"], dict):
         errors.append("'summary' must be a dict")
 
-    if "schema_version" in data:
-        parts = data["schema_version"].split(".")
-        if len(parts) != 3 or not all(p.isdigit() for p in parts):
-            errors.append("'schema_version' must be semantic version (X.Y.Z)")
+    if "schema_version" in data and not _SEMVER_RE.match(data["schema_version"]):
+        errors.append("'schema_version' must be semantic version (X.Y.Z)")
 
     return (len(errors) == 0, errors)
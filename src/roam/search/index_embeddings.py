@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import math
+import struct
+from array import array
 
 from roam.search.tfidf import tokenize, cosine_similarity
 
@@ -15,132 +19,526 @@ TFIDF_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS symbol_tfidf (
     symbol_id INTEGER PRIMARY KEY REFERENCES symbols(id),
     terms TEXT NOT NULL,
+    normalized INTEGER DEFAULT 0,
+    norm REAL DEFAULT 1.0,
     updated_at TEXT DEFAULT (datetime('now'))
 );
+
+CREATE TABLE IF NOT EXISTS tfidf_terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    df INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS tfidf_postings (
+    term_id INTEGER NOT NULL REFERENCES tfidf_terms(id) ON DELETE CASCADE,
+    symbol_id INTEGER NOT NULL REFERENCES symbols(id) ON DELETE CASCADE,
+    weight REAL NOT NULL,
+    bm25 REAL DEFAULT 0.0
+);
+
+CREATE INDEX IF NOT EXISTS idx_tfidf_postings_term ON tfidf_postings(term_id);
 """
 
 
 def ensure_tfidf_table(conn):
-    """Create the symbol_tfidf table if it does not exist."""
-    conn.execute(TFIDF_TABLE_SQL)
+    """Create the symbol_tfidf + inverted-index tables if missing.
+
+    Safe on readonly connections: DDL only runs when a table is absent,
+    and a failed write falls through — the readers all degrade to their
+    legacy paths when tables or columns are missing.
+    """
+    existing = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name IN ('symbol_tfidf', 'tfidf_terms', 'tfidf_postings')"
+        )
+    }
+    if len(existing) < 3:
+        # Checked first because executescript also implicitly commits
+        # any transaction the caller (the indexer) has open
+        try:
+            conn.executescript(TFIDF_TABLE_SQL)
+        except Exception:
+            return  # Readonly database with a pre-series index
+    # Migrations: columns added to tables created before this version
+    for ddl in (
+        "ALTER TABLE symbol_tfidf ADD COLUMN normalized INTEGER DEFAULT 0",
+        "ALTER TABLE symbol_tfidf ADD COLUMN norm REAL DEFAULT 1.0",
+        "ALTER TABLE tfidf_terms ADD COLUMN df INTEGER DEFAULT 0",
+        "ALTER TABLE tfidf_postings ADD COLUMN bm25 REAL DEFAULT 0.0",
+    ):
+        try:
+            conn.execute(ddl)
+        except Exception:
+            pass  # Column already exists (or connection is readonly)
+
+
+# ---------------------------------------------------------------------------
+# Packed vector encoding
+#
+# Vectors are stored as one BLOB per symbol (ids reference tfidf_terms).
+# Two layouts, distinguished by the row's ``normalized`` flag:
+#
+#   flag 1 — int32 term ids followed by float32 weights
+#   flag 2 — float32 per-row scale, int32 term ids, int8 quantized
+#            weights (w = q * scale); unit-normalized weights live in
+#            [0, 1] so scale = max(w) / 127 loses <0.5% per component,
+#            negligible for cosine ranking, and shrinks the weight
+#            payload 4x
+#
+# Decoding is array.frombytes calls instead of a json.loads per row —
+# no per-term string allocation until the caller needs term names.
+# ---------------------------------------------------------------------------
+
+NORMALIZED_PACKED = 1
+NORMALIZED_QUANTIZED = 2
+
+
+def _pack_vector(vec_ids: list[int], weights: list[float]) -> bytes:
+    """Encode parallel (term_id, weight) lists as a single BLOB."""
+    return array("i", vec_ids).tobytes() + array("f", weights).tobytes()
+
+
+def _unpack_vector(blob: bytes) -> tuple[array, array]:
+    """Decode a float32-packed BLOB back into (term_ids, weights) arrays."""
+    half = len(blob) // 2
+    ids = array("i")
+    ids.frombytes(blob[:half])
+    weights = array("f")
+    weights.frombytes(blob[half:])
+    return ids, weights
+
+
+def _pack_vector_q8(vec_ids: list[int], weights: list[float]) -> bytes:
+    """Encode (term_id, weight) lists with int8-quantized weights."""
+    peak = max(weights) if weights else 0.0
+    scale = peak / 127.0 if peak > 0.0 else 1.0
+    quants = [int(round(w / scale)) for w in weights]
+    return (
+        struct.pack("<f", scale)
+        + array("i", vec_ids).tobytes()
+        + array("b", quants).tobytes()
+    )
+
+
+def _unpack_vector_q8(blob: bytes) -> tuple[array, list[float]]:
+    """Decode a quantized BLOB back into (term_ids, weights)."""
+    scale = struct.unpack_from("<f", blob)[0]
+    body = blob[4:]
+    n = len(body) // 5
+    ids = array("i")
+    ids.frombytes(body[: 4 * n])
+    quants = array("b")
+    quants.frombytes(body[4 * n:])
+    return ids, [q * scale for q in quants]
 
 
 # ---------------------------------------------------------------------------
 # Build & store
 # ---------------------------------------------------------------------------
 
+# Okapi BM25 parameters (standard defaults)
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
 def build_and_store_tfidf(conn):
     """Compute TF-IDF vectors for all symbols and store in symbol_tfidf.
 
     Called during ``roam index`` to pre-compute vectors for fast search.
+    Consumes the interned CSR corpus directly: term ids flow straight
+    from the in-memory vocab into the packed blobs, postings, and
+    tfidf_terms rows, so no string-keyed per-symbol dicts are built
+    anywhere in the pipeline.
     """
-    from roam.search.tfidf import build_corpus
+    from roam.search.tfidf import build_corpus_csr
 
     ensure_tfidf_table(conn)
 
-    corpus = build_corpus(conn)
-    if not corpus:
+    corpus = build_corpus_csr(conn)
+    if not len(corpus):
         return
 
     # Clear old data
     conn.execute("DELETE FROM symbol_tfidf")
-
-    # Insert in batches
+    conn.execute("DELETE FROM tfidf_postings")
+    conn.execute("DELETE FROM tfidf_terms")
+
+    # Insert in batches — vectors are scaled to unit L2 first so cosine
+    # against them reduces to a dot product at query time.  The same
+    # pass feeds the inverted index (term -> posting list) that lets
+    # search_stored score only symbols sharing a query term.
+    insert_sql = (
+        "INSERT OR REPLACE INTO symbol_tfidf (symbol_id, terms, normalized, norm) "
+        f"VALUES (?, ?, {NORMALIZED_QUANTIZED}, ?)"
+    )
+    indptr = corpus.indptr
+    indices = corpus.indices
+    data = corpus.data
+    dfs = corpus.dfs
+    n_docs = len(corpus)
+
+    # BM25 inputs, fixed at build time: per-term document frequency and
+    # the average document length (nonzero terms per row).  The smoothed
+    # IDF baked into the CSR weights is unwound per posting to recover
+    # the max-normalized term frequency BM25 saturates over.
+    doc_lens = [indptr[i + 1] - indptr[i] for i in range(n_docs)]
+    avgdl = sum(doc_lens) / n_docs if n_docs else 1.0
+    if avgdl <= 0.0:
+        avgdl = 1.0
+    idf_smoothed = [math.log((n_docs + 1) / (df + 1)) + 1 for df in dfs]
+    idf_bm25 = [
+        math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5)) for df in dfs
+    ]
+
+    postings: list[tuple[int, int, float, float]] = []
     batch = []
-    for sid, vec in corpus.items():
-        terms_json = json.dumps(vec)
-        batch.append((sid, terms_json))
-        if len(batch) >= 500:
-            conn.executemany(
-                "INSERT OR REPLACE INTO symbol_tfidf (symbol_id, terms) VALUES (?, ?)",
-                batch,
+    for i, sid in enumerate(corpus.sym_ids):
+        start, end = indptr[i], indptr[i + 1]
+        # Corpus vocab ids are 0-based; table ids are 1-based
+        vec_ids = [indices[j] + 1 for j in range(start, end)]
+        raw = [data[j] for j in range(start, end)]
+        # Persist the raw L2 norm alongside the unit vector so no reader
+        # ever has to recompute a magnitude
+        raw_norm = math.sqrt(sum(v * v for v in raw))
+        weights = [v / raw_norm for v in raw] if raw_norm > 0.0 else raw
+        dl_factor = _BM25_K1 * (
+            1.0 - _BM25_B + _BM25_B * doc_lens[i] / avgdl
+        )
+        bm25 = []
+        for j in range(start, end):
+            tid = indices[j]
+            tf = data[j] / idf_smoothed[tid]
+            bm25.append(
+                idf_bm25[tid] * tf * (_BM25_K1 + 1.0) / (tf + dl_factor)
             )
+        postings.extend(zip(vec_ids, (sid,) * len(vec_ids), weights, bm25))
+        batch.append((sid, _pack_vector_q8(vec_ids, weights), raw_norm))
+        if len(batch) >= 500:
+            conn.executemany(insert_sql, batch)
             batch.clear()
 
     if batch:
-        conn.executemany(
-            "INSERT OR REPLACE INTO symbol_tfidf (symbol_id, terms) VALUES (?, ?)",
-            batch,
-        )
+        conn.executemany(insert_sql, batch)
+
+    conn.executemany(
+        "INSERT INTO tfidf_terms (id, term, df) VALUES (?, ?, ?)",
+        [(tid + 1, t, dfs[tid]) for t, tid in corpus.vocab.items()],
+    )
+    conn.executemany(
+        "INSERT INTO tfidf_postings (term_id, symbol_id, weight, bm25) "
+        "VALUES (?, ?, ?, ?)",
+        postings,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Load stored vectors
 # ---------------------------------------------------------------------------
 
-def load_tfidf_vectors(conn) -> dict[int, dict[str, float]]:
-    """Load stored vectors from DB.
+class SparseVec:
+    """Compact sparse vector: parallel term-id/weight arrays + L2 norm.
+
+    8 bytes per nonzero (int32 id, float32 weight) versus the ~64 bytes
+    a ``{term: float}`` dict entry costs, and it decodes straight from
+    the packed blobs with no per-term string allocation.  Internal
+    scoring goes through this; the public dict API in
+    :func:`load_tfidf_vectors` is unchanged.
+    """
+
+    __slots__ = ("ids", "weights", "norm")
 
-    Returns ``{symbol_id: {term: score}}``.
+    def __init__(self, ids, weights, norm: float):
+        self.ids = ids
+        self.weights = weights
+        self.norm = norm
+
+    def dot(self, q_by_id: dict[int, float]) -> float:
+        """Dot product against a query keyed by the same term ids."""
+        q_get = q_by_id.get
+        total = 0.0
+        for tid, w in zip(self.ids, self.weights):
+            qw = q_get(tid)
+            if qw is not None:
+                total += qw * w
+        return total
+
+
+def _load_sparse_vectors(conn) -> dict[int, SparseVec] | None:
+    """Decode stored blobs into :class:`SparseVec` objects, id-keyed.
+
+    Returns None when any row predates the packed format (legacy JSON
+    text) — those carry term names rather than ids, so callers fall
+    back to the dict loader.
+    """
+    try:
+        rows = conn.execute(
+            "SELECT symbol_id, terms, normalized FROM symbol_tfidf"
+        ).fetchall()
+    except Exception:
+        return None
+
+    result: dict[int, SparseVec] = {}
+    for row in rows:
+        terms = row["terms"]
+        if not isinstance(terms, bytes):
+            return None
+        if row["normalized"] == NORMALIZED_QUANTIZED:
+            ids, weights = _unpack_vector_q8(terms)
+        else:
+            ids, weights = _unpack_vector(terms)
+        # Packed rows are written unit-scaled (see build_and_store_tfidf)
+        norm = 1.0 if row["normalized"] else math.sqrt(
+            sum(w * w for w in weights)
+        )
+        result[row["symbol_id"]] = SparseVec(ids, weights, norm)
+    return result
+
+def load_tfidf_vectors(conn) -> tuple[dict[int, dict[str, float]], dict[int, float]]:
+    """Load stored vectors and their persisted L2 norms from DB.
+
+    Returns ``({symbol_id: {term: score}}, {symbol_id: norm})``.  The
+    norm is the vector's magnitude as stored (1.0 for rows written since
+    pre-normalization), so callers never recompute sum-of-squares.
     """
     ensure_tfidf_table(conn)
-    rows = conn.execute(
-        "SELECT symbol_id, terms FROM symbol_tfidf"
-    ).fetchall()
+    try:
+        rows = conn.execute(
+            "SELECT symbol_id, terms, normalized, norm FROM symbol_tfidf"
+        ).fetchall()
+        has_norms = True
+    except Exception:
+        rows = conn.execute(
+            "SELECT symbol_id, terms FROM symbol_tfidf"
+        ).fetchall()
+        has_norms = False
+
+    # Packed rows reference terms by id; resolve names once for all rows
+    term_names: dict[int, str] = {}
+    if any(isinstance(row["terms"], bytes) for row in rows):
+        term_names = {
+            r[0]: r[1] for r in conn.execute("SELECT id, term FROM tfidf_terms")
+        }
 
     result: dict[int, dict[str, float]] = {}
+    norms: dict[int, float] = {}
     for row in rows:
-        try:
-            vec = json.loads(row["terms"])
-            result[row["symbol_id"]] = vec
-        except (json.JSONDecodeError, TypeError):
-            continue
-    return result
+        terms = row["terms"]
+        if isinstance(terms, bytes):
+            if has_norms and row["normalized"] == NORMALIZED_QUANTIZED:
+                ids, weights = _unpack_vector_q8(terms)
+            else:
+                ids, weights = _unpack_vector(terms)
+            vec = {
+                term_names[tid]: w
+                for tid, w in zip(ids, weights)
+                if tid in term_names
+            }
+        else:
+            try:
+                vec = json.loads(terms)
+            except (json.JSONDecodeError, TypeError):
+                continue
+        sid = row["symbol_id"]
+        result[sid] = vec
+        if has_norms and row["normalized"]:
+            norms[sid] = 1.0  # Stored unit-scaled; raw norm kept in row["norm"]
+        else:
+            norms[sid] = math.sqrt(sum(v * v for v in vec.values()))
+    return result, norms
 
 
 # ---------------------------------------------------------------------------
 # Search using stored vectors
 # ---------------------------------------------------------------------------
 
-def search_stored(conn, query: str, top_k: int = 10) -> list[dict]:
-    """Search using pre-computed stored vectors (fast).
+# Repeated queries in one process (MCP server, test suites) skip both
+# tokenization and TF assembly.  Cached dicts are treated as read-only
+# by every consumer in this module.
+_QUERY_CACHE_MAX = 32
+_query_cache: dict[str, dict[str, float]] = {}
 
-    Returns top-k results: ``[{score, symbol_id, name, file_path, kind, line_start}]``.
-    """
-    query_tokens = tokenize(query)
-    if not query_tokens:
-        return []
 
-    # Build query vector
+def _query_tf(query: str) -> dict[str, float]:
+    """Term-frequency vector for a query string, cached per process."""
+    cached = _query_cache.get(query)
+    if cached is not None:
+        return cached
+
     query_vec: dict[str, float] = {}
-    for t in query_tokens:
+    for t in tokenize(query):
         query_vec[t] = query_vec.get(t, 0) + 1
 
-    # Load stored vectors
-    vectors = load_tfidf_vectors(conn)
+    if len(_query_cache) >= _QUERY_CACHE_MAX:
+        _query_cache.clear()
+    _query_cache[query] = query_vec
+    return query_vec
+
+
+# Hybrid score mix: alpha on the cosine side, the rest on max-normalized
+# BM25.  Cosine carries the ranking; BM25 adds exact-match signal for
+# terms rare in the corpus
+_HYBRID_ALPHA = 0.7
+
+
+def _score_postings(conn, query_vec: dict[str, float]) -> list[tuple[float, int]] | None:
+    """Score candidates via the inverted index, hybrid cosine + BM25.
+
+    Walks the posting list of each query term once, so cost is
+    proportional to the document frequency of the query terms instead of
+    the corpus size.  Each posting row carries both the unit-L2 TF-IDF
+    weight and a precomputed BM25 term weight, and the single walk
+    accumulates both sums; the final score blends them via
+    ``_HYBRID_ALPHA`` (pure cosine when the index predates the bm25
+    column).  Returns None when the postings tables are missing or empty
+    (index written by an older version).
+    """
+    try:
+        n_postings = conn.execute(
+            "SELECT COUNT(*) FROM tfidf_postings"
+        ).fetchone()[0]
+    except Exception:
+        return None
+    if not n_postings:
+        return None
+
+    q_norm = math.sqrt(sum(w * w for w in query_vec.values()))
+    if q_norm == 0.0:
+        return []
+
+    ph = ",".join("?" for _ in query_vec)
+    term_ids = {
+        row[0]: row[1]
+        for row in conn.execute(
+            f"SELECT term, id FROM tfidf_terms WHERE term IN ({ph})",
+            list(query_vec),
+        )
+    }
+    if not term_ids:
+        return []
+
+    # One round trip for all query terms' postings instead of a query
+    # per term; q_by_id resolves the term's query weight per posting row
+    q_by_id = {tid: query_vec[t] for t, tid in term_ids.items()}
+    id_ph = ",".join("?" for _ in q_by_id)
+    try:
+        rows = conn.execute(
+            f"SELECT term_id, symbol_id, weight, bm25 FROM tfidf_postings "
+            f"WHERE term_id IN ({id_ph})",
+            list(q_by_id),
+        ).fetchall()
+    except Exception:
+        # Index written before the bm25 column — cosine only
+        rows = [
+            (term_id, sid, weight, 0.0)
+            for term_id, sid, weight in conn.execute(
+                f"SELECT term_id, symbol_id, weight FROM tfidf_postings "
+                f"WHERE term_id IN ({id_ph})",
+                list(q_by_id),
+            )
+        ]
+
+    # Fused accumulation: cosine dot and BM25 sum in the same walk —
+    # the postings are already in hand, BM25 costs no extra I/O
+    acc: dict[int, float] = {}
+    acc_bm25: dict[int, float] = {}
+    for term_id, sid, weight, bm25 in rows:
+        qw = q_by_id[term_id]
+        acc[sid] = acc.get(sid, 0.0) + qw * weight
+        if bm25:
+            acc_bm25[sid] = acc_bm25.get(sid, 0.0) + qw * bm25
+
+    max_bm25 = max(acc_bm25.values()) if acc_bm25 else 0.0
+    if max_bm25 <= 0.0:
+        return [(dot / q_norm, sid) for sid, dot in acc.items() if dot > 0.0]
+
+    alpha = _HYBRID_ALPHA
+    bm25_get = acc_bm25.get
+    return [
+        (alpha * (dot / q_norm) + (1.0 - alpha) * (bm25_get(sid, 0.0) / max_bm25), sid)
+        for sid, dot in acc.items()
+        if dot > 0.0
+    ]
+
+
+def _score_full_scan(conn, query_vec: dict[str, float]) -> list[tuple[float, int]]:
+    """Fallback path: cosine against every stored vector.
+
+    Packed rows score through :class:`SparseVec` — the query's terms
+    are mapped to table ids once and every dot product walks flat
+    arrays, never rebuilding string-keyed dicts.  Only rows stored as
+    legacy JSON drop down to the dict-based cosine.
+    """
+    sparse = _load_sparse_vectors(conn)
+    if sparse is not None:
+        if not sparse:
+            return []
+        q_norm = math.sqrt(sum(w * w for w in query_vec.values()))
+        if q_norm == 0.0:
+            return []
+        ph = ",".join("?" for _ in query_vec)
+        q_by_id = {
+            row[1]: query_vec[row[0]]
+            for row in conn.execute(
+                f"SELECT term, id FROM tfidf_terms WHERE term IN ({ph})",
+                list(query_vec),
+            )
+        }
+        if not q_by_id:
+            return []
+        scores = []
+        for sid, vec in sparse.items():
+            dot = vec.dot(q_by_id)
+            if dot > 0.0 and vec.norm > 0.0:
+                scores.append((dot / (q_norm * vec.norm), sid))
+        return scores
+
+    vectors, norms = load_tfidf_vectors(conn)
     if not vectors:
         return []
 
-    # Score every symbol
-    scores: list[tuple[float, int]] = []
+    scores = []
     for sid, vec in vectors.items():
-        sim = cosine_similarity(query_vec, vec)
+        sim = cosine_similarity(query_vec, vec, norm_b=norms.get(sid))
         if sim > 0:
             scores.append((sim, sid))
+    return scores
+
+
+def search_stored(conn, query: str, top_k: int = 10) -> list[dict]:
+    """Search using pre-computed stored vectors (fast).
+
+    Returns top-k results: ``[{score, symbol_id, name, file_path, kind, line_start}]``.
+    """
+    query_vec = _query_tf(query)
+    if not query_vec:
+        return []
+
+    # Inverted-index path: only symbols sharing a query term are scored
+    scores = _score_postings(conn, query_vec)
+    if scores is None:
+        # Index predates the postings tables — full scan over stored vectors
+        scores = _score_full_scan(conn, query_vec)
 
     if not scores:
         return []
 
-    # Sort by score descending
-    scores.sort(key=lambda x: -x[0])
-    top = scores[:top_k]
+    # Top-k without sorting the tail: O(N + k log k) vs O(N log N)
+    top = heapq.nlargest(top_k, scores)
 
     # Fetch metadata for top results
     sym_ids = [sid for _, sid in top]
-    batch_size = 400
-    meta: dict[int, dict] = {}
-    for i in range(0, len(sym_ids), batch_size):
-        batch = sym_ids[i : i + batch_size]
-        ph = ",".join("?" for _ in batch)
-        rows = conn.execute(
-            f"SELECT s.id, s.name, f.path as file_path, s.kind, "
-            f"s.line_start, s.line_end "
-            f"FROM symbols s JOIN files f ON s.file_id = f.id "
-            f"WHERE s.id IN ({ph})",
-            batch,
-        ).fetchall()
-        for r in rows:
-            meta[r["id"]] = r
+    from roam.db.connection import batched_in
+    rows = batched_in(
+        conn,
+        "SELECT s.id, s.name, f.path as file_path, s.kind, "
+        "s.line_start, s.line_end "
+        "FROM symbols s JOIN files f ON s.file_id = f.id "
+        "WHERE s.id IN ({ph})",
+        sym_ids,
+    )
+    meta: dict[int, dict] = {r["id"]: r for r in rows}
 
     results = []
     for score, sid in top:
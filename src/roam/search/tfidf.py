@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 import math
+import os
 import re
+from array import array
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Stopwords: common English + common code tokens
@@ -29,29 +33,47 @@ _SUFFIXES = (
     "tion", "ment", "ness", "able", "ible", "ing", "est", "ly", "ed", "er",
 )
 
+# Precompiled tokenizer patterns — tokenize runs once per symbol field
+# at index time, so pattern compilation must not sit in the loop
+_SPLIT_RE = re.compile(r"[^a-zA-Z0-9]+")
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+_ACRONYM_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+
 
 def tokenize(text: str) -> list[str]:
     """Split text into tokens: lowercase, split on non-alnum, filter stopwords, stem."""
     if not text:
         return []
-    # Split on non-alphanumeric first (preserve case for camelCase detection)
-    raw = re.split(r"[^a-zA-Z0-9]+", text)
+    return list(_tokenize_cached(text))
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str) -> tuple[str, ...]:
+    """Memoized tokenizer core.
+
+    Symbol corpora repeat short strings heavily (identical signatures,
+    kinds, name fragments) and the same query string recurs across CLI
+    calls in one process.  Returns an immutable tuple so cache hits can
+    never be mutated by callers; tokenize copies to a list at the edge.
+    """
     tokens = []
-    for tok in raw:
+    stopwords = _STOPWORDS
+    # Split on non-alphanumeric first (preserve case for camelCase detection)
+    for tok in _SPLIT_RE.split(text):
         if not tok:
             continue
-        # camelCase / PascalCase split (before lowercasing)
-        parts = re.sub(r"([a-z])([A-Z])", r"\1 \2", tok)
-        # Also split on transitions like "XMLParser" -> "XML Parser"
-        parts = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", parts)
+        # camelCase / PascalCase split (before lowercasing), then acronym
+        # transitions like "XMLParser" -> "XML Parser"
+        parts = _CAMEL_RE.sub(r"\1 \2", tok)
+        parts = _ACRONYM_RE.sub(r"\1 \2", parts)
         for part in parts.split():
             part = part.lower()
-            if part in _STOPWORDS or len(part) < 2:
+            if part in stopwords or len(part) < 2:
                 continue
             stemmed = _stem(part)
-            if stemmed and stemmed not in _STOPWORDS and len(stemmed) >= 2:
+            if stemmed and stemmed not in stopwords and len(stemmed) >= 2:
                 tokens.append(stemmed)
-    return tokens
+    return tuple(tokens)
 
 
 def _stem(word: str) -> str:
@@ -66,61 +88,120 @@ def _stem(word: str) -> str:
 # TF-IDF computation
 # ---------------------------------------------------------------------------
 
-def build_corpus(conn) -> dict[int, dict[str, float]]:
-    """Build a TF-IDF corpus from the symbols table.
+# Below this many symbols the fork/pickle overhead of a worker pool
+# outweighs the tokenization work itself
+_PARALLEL_MIN_DOCS = 5000
 
-    Returns ``{symbol_id: {term: tfidf_score}}``.
+
+def _doc_tf(name: str, qualified_name: str, signature: str,
+            kind: str) -> dict[str, float]:
+    """Max-normalized term frequencies for one symbol's text fields.
+
+    Weight: name 3x, qualified_name 2x, signature 1x, kind 1x.
     """
-    rows = conn.execute(
-        "SELECT s.id, s.name, s.qualified_name, s.signature, s.kind "
-        "FROM symbols s"
-    ).fetchall()
+    tokens: list[str] = []
+    tokens.extend(tokenize(name) * 3)
+    tokens.extend(tokenize(qualified_name) * 2)
+    tokens.extend(tokenize(signature))
+    tokens.extend(tokenize(kind))
 
-    if not rows:
+    if not tokens:
         return {}
 
-    # Build per-document term frequencies
-    doc_tfs: dict[int, dict[str, float]] = {}
-    df: dict[str, int] = {}  # document frequency per term
-
-    for row in rows:
-        sid = row["id"]
-        # Weight: name 3x, qualified_name 2x, signature 1x, kind 1x
-        tokens: list[str] = []
-        name_tokens = tokenize(row["name"] or "")
-        tokens.extend(name_tokens * 3)
-        qn_tokens = tokenize(row["qualified_name"] or "")
-        tokens.extend(qn_tokens * 2)
-        tokens.extend(tokenize(row["signature"] or ""))
-        tokens.extend(tokenize(row["kind"] or ""))
-
-        if not tokens:
-            continue
+    # Compute raw TF
+    tf: dict[str, float] = {}
+    for t in tokens:
+        tf[t] = tf.get(t, 0) + 1
 
-        # Compute raw TF
-        tf: dict[str, float] = {}
-        for t in tokens:
-            tf[t] = tf.get(t, 0) + 1
+    # Normalize TF by max frequency
+    max_freq = max(tf.values())
+    for t in tf:
+        tf[t] = tf[t] / max_freq
+
+    return tf
 
-        # Normalize TF by max frequency
-        max_freq = max(tf.values()) if tf else 1
-        for t in tf:
-            tf[t] = tf[t] / max_freq
 
-        doc_tfs[sid] = tf
+def _tf_chunk(records: list[tuple]) -> tuple[list[tuple[int, dict]], dict]:
+    """Worker: per-document TFs + partial document frequency for a chunk.
 
-        # Update document frequency (each term counted once per doc)
+    Module-level so multiprocessing can pickle it; takes and returns
+    plain tuples/dicts only.
+    """
+    doc_tfs: list[tuple[int, dict]] = []
+    df: dict[str, int] = {}
+    for sid, name, qualified_name, signature, kind in records:
+        tf = _doc_tf(name, qualified_name, signature, kind)
+        if not tf:
+            continue
+        doc_tfs.append((sid, tf))
         for t in tf:
             df[t] = df.get(t, 0) + 1
+    return doc_tfs, df
+
+
+def _doc_term_stats(conn) -> tuple[dict[int, dict[str, float]], dict[str, int]]:
+    """Tokenize every symbol and return per-document TFs + document frequency.
+
+    Returns ``(doc_tfs, df)`` where ``doc_tfs`` maps symbol_id to
+    max-normalized term frequencies and ``df`` counts documents per term.
+    Large corpora are tokenized across a worker pool; chunk results are
+    merged in submission order so output is deterministic either way.
+    """
+    records = [
+        (row[0], row[1] or "", row[2] or "", row[3] or "", row[4] or "")
+        for row in conn.execute(
+            "SELECT s.id, s.name, s.qualified_name, s.signature, s.kind "
+            "FROM symbols s"
+        )
+    ]
+
+    chunk_results: list[tuple[list[tuple[int, dict]], dict]]
+    n_workers = os.cpu_count() or 1
+    if len(records) >= _PARALLEL_MIN_DOCS and n_workers > 1:
+        try:
+            from multiprocessing import Pool
+            chunk_size = (len(records) + n_workers - 1) // n_workers
+            chunks = [
+                records[i : i + chunk_size]
+                for i in range(0, len(records), chunk_size)
+            ]
+            with Pool(len(chunks)) as pool:
+                chunk_results = pool.map(_tf_chunk, chunks)
+        except Exception:
+            chunk_results = [_tf_chunk(records)]  # Pool unavailable
+    else:
+        chunk_results = [_tf_chunk(records)]
+
+    doc_tfs: dict[int, dict[str, float]] = {}
+    df: dict[str, int] = {}
+    for chunk_tfs, chunk_df in chunk_results:
+        doc_tfs.update(chunk_tfs)
+        for t, count in chunk_df.items():
+            df[t] = df.get(t, 0) + count
+
+    return doc_tfs, df
+
+
+def _smoothed_idf(df: dict[str, int], n_docs: int) -> dict[str, float]:
+    """Smoothed inverse document frequency per term."""
+    return {
+        t: math.log((n_docs + 1) / (count + 1)) + 1
+        for t, count in df.items()
+    }
+
+
+def build_corpus(conn) -> dict[int, dict[str, float]]:
+    """Build a TF-IDF corpus from the symbols table.
+
+    Returns ``{symbol_id: {term: tfidf_score}}``.
+    """
+    doc_tfs, df = _doc_term_stats(conn)
 
-    # Compute IDF
     n_docs = len(doc_tfs)
     if n_docs == 0:
         return {}
 
-    idf: dict[str, float] = {}
-    for t, count in df.items():
-        idf[t] = math.log((n_docs + 1) / (count + 1)) + 1  # smoothed IDF
+    idf = _smoothed_idf(df, n_docs)
 
     # Compute TF-IDF vectors
     result: dict[int, dict[str, float]] = {}
@@ -133,6 +214,118 @@ def build_corpus(conn) -> dict[int, dict[str, float]]:
     return result
 
 
+class TfidfCorpus:
+    """CSR-layout sparse TF-IDF matrix over interned term ids.
+
+    Instead of one ``{term: weight}`` dict per symbol (~80 bytes per
+    nonzero in string keys and boxed floats), the whole corpus lives in
+    three flat arrays: ``indptr`` delimits each row's slice of
+    ``indices`` (int term ids) and ``data`` (float32 weights).  Scoring
+    walks contiguous array slices with integer lookups — no string
+    hashing in the inner loop.
+    """
+
+    __slots__ = ("vocab", "sym_ids", "indptr", "indices", "data", "norms",
+                 "dfs", "_columns")
+
+    def __init__(self):
+        self.vocab: dict[str, int] = {}
+        self.sym_ids: list[int] = []
+        self.indptr = array("l", [0])
+        self.indices = array("l")
+        self.data = array("f")
+        self.norms: list[float] = []
+        self.dfs: list[int] = []
+        self._columns: dict[int, list[tuple[int, float]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.sym_ids)
+
+    def columns(self) -> dict[int, list[tuple[int, float]]]:
+        """Column view: ``{term_id: [(row_index, weight), ...]}``.
+
+        Built lazily from the row-major CSR arrays on first use and
+        cached, so the one transposition pass amortizes across every
+        short query scored against this corpus.
+        """
+        if self._columns is None:
+            cols: dict[int, list[tuple[int, float]]] = {}
+            indptr = self.indptr
+            indices = self.indices.tolist()
+            data = self.data.tolist()
+            start = 0
+            for i in range(len(self.sym_ids)):
+                end = indptr[i + 1]
+                for j in range(start, end):
+                    cols.setdefault(indices[j], []).append((i, data[j]))
+                start = end
+            self._columns = cols
+        return self._columns
+
+    def query_weights(self, tokens: list[str]) -> tuple[dict[int, float], float]:
+        """Map query tokens to ``({term_id: weight}, query_norm)``.
+
+        Out-of-vocabulary terms are dropped from the weights (they can
+        never match a document) but still contribute to the norm, so
+        scores are identical to the full dict-based cosine.
+        """
+        tf: dict[str, float] = {}
+        for t in tokens:
+            tf[t] = tf.get(t, 0.0) + 1.0
+        norm = math.sqrt(sum(w * w for w in tf.values()))
+        vocab = self.vocab
+        weights = {
+            vocab[t]: w for t, w in tf.items() if t in vocab
+        }
+        return weights, norm
+
+
+def build_corpus_csr(conn) -> TfidfCorpus:
+    """Build the corpus as a :class:`TfidfCorpus` (CSR arrays + vocab)."""
+    corpus = TfidfCorpus()
+    doc_tfs, df = _doc_term_stats(conn)
+
+    n_docs = len(doc_tfs)
+    if n_docs == 0:
+        return corpus
+
+    idf = _smoothed_idf(df, n_docs)
+
+    vocab = corpus.vocab
+    indices = corpus.indices
+    data = corpus.data
+    for sid, tf in doc_tfs.items():
+        for t, tf_val in tf.items():
+            tid = vocab.setdefault(t, len(vocab))
+            indices.append(tid)
+            data.append(tf_val * idf.get(t, 1.0))
+        corpus.sym_ids.append(sid)
+        corpus.indptr.append(len(indices))
+
+    # Per-row norms from the float32-rounded stored weights, summed in
+    # row order so they match what an inline accumulation would produce
+    indptr = corpus.indptr
+    stored = corpus.data.tolist()
+    start = 0
+    for i in range(len(corpus.sym_ids)):
+        end = indptr[i + 1]
+        norm_sq = 0.0
+        for j in range(start, end):
+            v = stored[j]
+            norm_sq += v * v
+        corpus.norms.append(math.sqrt(norm_sq))
+        start = end
+
+    # Document frequency per term id — BM25 consumers need it alongside
+    # the weights, and it lets them unwind the smoothed IDF baked into
+    # data to recover raw term frequencies
+    corpus.dfs = [0] * len(vocab)
+    for t, tid in vocab.items():
+        corpus.dfs[tid] = df.get(t, 0)
+
+    return corpus
+
+
 def compute_tfidf_vectors(conn) -> list[dict]:
     """Return list of ``{symbol_id, name, file_path, kind, vector}`` dicts."""
     corpus = build_corpus(conn)
@@ -172,31 +365,128 @@ def compute_tfidf_vectors(conn) -> list[dict]:
     return results
 
 
+def _score_rows(corpus: TfidfCorpus, query_weights: dict[int, float],
+                q_norm: float) -> list[tuple[float, int]]:
+    """Scoring kernel: cosine of the query against every corpus row.
+
+    Everything the inner loop touches is bound to locals, and the CSR
+    arrays are materialised as plain lists once up front — list indexing
+    avoids the per-access unboxing of ``array.array`` in CPython, which
+    is the closest this zero-dependency codebase gets to handing the
+    loop to a compiled kernel.
+    """
+    scores: list[tuple[float, int]] = []
+    append = scores.append
+    indptr = corpus.indptr
+    indices = corpus.indices.tolist()
+    data = corpus.data.tolist()
+    norms = corpus.norms
+    q_get = query_weights.get
+    start = 0
+    for i, sid in enumerate(corpus.sym_ids):
+        end = indptr[i + 1]
+        dot = 0.0
+        for j in range(start, end):
+            w = q_get(indices[j])
+            if w is not None:
+                dot += w * data[j]
+        start = end
+        if dot > 0.0 and norms[i] > 0.0:
+            append((dot / (q_norm * norms[i]), sid))
+    return scores
+
+
+# Queries this short score faster via per-term posting walks than a full
+# row scan — typical symbol searches are 1-3 terms
+_SMALL_QUERY_MAX_TERMS = 4
+
+
+def _score_columns(corpus: TfidfCorpus, query_weights: dict[int, float],
+                   q_norm: float) -> list[tuple[float, int]]:
+    """Scoring kernel specialized for short queries.
+
+    Instead of scanning every row, walk only the posting lists of the
+    query's 1-4 terms (via :meth:`TfidfCorpus.columns`), accumulating
+    dot products per matching row.  Rows sharing no term with the query
+    are never touched.  Produces exactly the same scores as
+    :func:`_score_rows`.
+    """
+    columns = corpus.columns()
+    acc: dict[int, float] = {}
+    acc_get = acc.get
+    for tid, w in query_weights.items():
+        for row, v in columns.get(tid, ()):
+            acc[row] = acc_get(row, 0.0) + w * v
+    norms = corpus.norms
+    sym_ids = corpus.sym_ids
+    return [
+        (dot / (q_norm * norms[row]), sym_ids[row])
+        for row, dot in acc.items()
+        if dot > 0.0 and norms[row] > 0.0
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Similarity
 # ---------------------------------------------------------------------------
 
-def cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
-    """Cosine similarity between two sparse TF-IDF vectors (dicts)."""
+def cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float],
+                      assume_normalized: bool = False,
+                      norm_a: float | None = None,
+                      norm_b: float | None = None) -> float:
+    """Cosine similarity between two sparse TF-IDF vectors (dicts).
+
+    Callers holding precomputed magnitudes (e.g. the persisted norms
+    from load_tfidf_vectors) pass them via *norm_a*/*norm_b* to skip the
+    sum-of-squares passes.  ``assume_normalized=True`` is shorthand for
+    ``norm_b=1.0`` — stored vectors are pre-normalized at build time.
+    """
+    if vec_a is vec_b:
+        # Self-similarity is 1.0 by definition — skip the merge entirely
+        return 1.0 if vec_a else 0.0
+
     if not vec_a or not vec_b:
         return 0.0
 
-    # Dot product (only over shared keys)
+    # Fused pass: dot product and the smaller vector's sum of squares in
+    # one walk over the smaller dict, so hashing work is min(|a|, |b|)
+    # and the smaller side's norm comes for free
+    small, big = (vec_a, vec_b) if len(vec_a) <= len(vec_b) else (vec_b, vec_a)
+    small_is_a = small is vec_a
+    big_get = big.get
     dot = 0.0
-    for key in vec_a:
-        if key in vec_b:
-            dot += vec_a[key] * vec_b[key]
+    small_sq = 0.0
+    for key, val in small.items():
+        other = big_get(key)
+        if other is not None:
+            dot += val * other
+        small_sq += val * val
 
     if dot == 0.0:
         return 0.0
 
-    norm_a = math.sqrt(sum(v * v for v in vec_a.values()))
-    norm_b = math.sqrt(sum(v * v for v in vec_b.values()))
-
-    if norm_a == 0.0 or norm_b == 0.0:
+    if norm_b is None and assume_normalized:
+        norm_b = 1.0
+    norm_small = norm_a if small_is_a else norm_b
+    norm_big = norm_b if small_is_a else norm_a
+    if norm_small is None:
+        norm_small = math.sqrt(small_sq)
+    if norm_big is None:
+        # Only the larger vector still needs a separate values pass
+        norm_big = math.sqrt(sum(v * v for v in big.values()))
+
+    if norm_small == 0.0 or norm_big == 0.0:
         return 0.0
 
-    return dot / (norm_a * norm_b)
+    return dot / (norm_small * norm_big)
+
+
+def normalize_vector(vec: dict[str, float]) -> dict[str, float]:
+    """Scale a sparse vector to unit L2 norm (no-op on zero vectors)."""
+    norm = math.sqrt(sum(v * v for v in vec.values()))
+    if norm == 0.0:
+        return vec
+    return {t: v / norm for t, v in vec.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -212,29 +502,28 @@ def search(conn, query: str, top_k: int = 10) -> list[dict]:
     if not query_tokens:
         return []
 
-    # Build query vector (simple TF, no IDF needed for short queries)
-    query_vec: dict[str, float] = {}
-    for t in query_tokens:
-        query_vec[t] = query_vec.get(t, 0) + 1
-
-    # Build corpus
-    corpus = build_corpus(conn)
+    # Build corpus as CSR arrays + interned term ids
+    corpus = build_corpus_csr(conn)
     if not corpus:
         return []
 
-    # Score every symbol
-    scores: list[tuple[float, int]] = []
-    for sid, vec in corpus.items():
-        sim = cosine_similarity(query_vec, vec)
-        if sim > 0:
-            scores.append((sim, sid))
+    # Query vector keyed by term id (simple TF, no IDF for short queries)
+    query_weights, q_norm = corpus.query_weights(query_tokens)
+    if not query_weights or q_norm == 0.0:
+        return []
+
+    # Short queries walk only their terms' posting lists; longer ones
+    # fall through to the generic full-row kernel
+    if len(query_weights) <= _SMALL_QUERY_MAX_TERMS:
+        scores = _score_columns(corpus, query_weights, q_norm)
+    else:
+        scores = _score_rows(corpus, query_weights, q_norm)
 
     if not scores:
         return []
 
-    # Sort by score descending
-    scores.sort(key=lambda x: -x[0])
-    top = scores[:top_k]
+    # Top-k without sorting the tail: O(N + k log k) vs O(N log N)
+    top = heapq.nlargest(top_k, scores)
 
     # Fetch metadata for top results
     sym_ids = [sid for _, sid in top]
@@ -10,7 +10,48 @@ from click.testing import CliRunner
 
 from roam.cli import cli
 from roam.search.tfidf import tokenize, cosine_similarity, search, build_corpus
-from roam.search.index_embeddings import build_and_store_tfidf, load_tfidf_vectors, search_stored
+from roam.search.index_embeddings import (
+    _HYBRID_ALPHA,
+    SparseVec,
+    _load_sparse_vectors,
+    _pack_vector_q8,
+    _query_tf,
+    _score_postings,
+    _unpack_vector_q8,
+    build_and_store_tfidf,
+    load_tfidf_vectors,
+    search_stored,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_vector_db():
+    """In-memory DB with the roam schema, a few symbols, and stored vectors."""
+    import sqlite3
+    from roam.db.connection import ensure_schema
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    ensure_schema(conn)
+    conn.execute("INSERT INTO files (id, path, language) VALUES (1, 'a.py', 'python')")
+    symbols = [
+        (1, "open_database", "db.open_database", "def open_database(path)", "function"),
+        (2, "close_database", "db.close_database", "def close_database(conn)", "function"),
+        (3, "authenticate_user", "auth.authenticate_user", "def authenticate_user(u, p)", "function"),
+        (4, "handle_request", "web.handle_request", "def handle_request(req)", "function"),
+    ]
+    for sid, name, qname, sig, kind in symbols:
+        conn.execute(
+            "INSERT INTO symbols (id, file_id, name, qualified_name, signature, "
+            "kind, line_start, line_end) VALUES (?, 1, ?, ?, ?, ?, 1, 2)",
+            (sid, name, qname, sig, kind),
+        )
+    build_and_store_tfidf(conn)
+    conn.commit()
+    return conn
 
 
 # ---------------------------------------------------------------------------
@@ -181,6 +222,188 @@ class TestStoredVectors:
             assert results[0]["score"] > 0
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: stored-vector loading (SparseVec + dict API)
+# ---------------------------------------------------------------------------
+
+class TestLoadVectors:
+    def test_load_returns_vectors_and_norms(self):
+        """load_tfidf_vectors returns ({sid: {term: w}}, {sid: norm})."""
+        conn = _make_vector_db()
+        vectors, norms = load_tfidf_vectors(conn)
+        assert set(vectors) == {1, 2, 3, 4}
+        assert set(norms) == {1, 2, 3, 4}
+        for sid, vec in vectors.items():
+            assert vec, f"empty vector for symbol {sid}"
+            assert all(isinstance(t, str) for t in vec)
+            assert all(isinstance(w, float) for w in vec.values())
+            # Stored vectors are unit-scaled, so the persisted norm is 1.0
+            assert norms[sid] == 1.0
+        assert "database" in vectors[1]
+
+    def test_sparse_vec_dot(self):
+        """SparseVec.dot matches a hand-computed sparse dot product."""
+        from array import array
+        vec = SparseVec(array("i", [1, 3, 7]), array("f", [0.5, 0.25, 1.0]), 1.0)
+        assert vec.dot({3: 2.0, 7: 1.0}) == pytest.approx(1.5)
+        assert vec.dot({99: 4.0}) == 0.0
+        assert vec.dot({}) == 0.0
+
+    def test_sparse_vectors_match_dict_vectors(self):
+        """_load_sparse_vectors decodes the same data as the dict loader."""
+        conn = _make_vector_db()
+        sparse = _load_sparse_vectors(conn)
+        vectors, norms = load_tfidf_vectors(conn)
+        term_names = {
+            r[0]: r[1] for r in conn.execute("SELECT id, term FROM tfidf_terms")
+        }
+        assert sparse is not None and set(sparse) == set(vectors)
+        for sid, vec in sparse.items():
+            as_dict = {
+                term_names[tid]: w for tid, w in zip(vec.ids, vec.weights)
+            }
+            assert as_dict == pytest.approx(vectors[sid])
+            assert vec.norm == norms[sid]
+
+    def test_sparse_load_rejects_legacy_json(self):
+        """Legacy JSON rows force the dict fallback (returns None)."""
+        conn = _make_vector_db()
+        conn.execute(
+            "INSERT OR REPLACE INTO symbol_tfidf (symbol_id, terms, normalized) "
+            "VALUES (1, ?, 0)",
+            (json.dumps({"database": 0.6, "open": 0.4}),),
+        )
+        assert _load_sparse_vectors(conn) is None
+        # The dict loader still reads the mixed table
+        vectors, norms = load_tfidf_vectors(conn)
+        assert vectors[1] == {"database": 0.6, "open": 0.4}
+        assert norms[1] == pytest.approx((0.6 ** 2 + 0.4 ** 2) ** 0.5)
+
+
+# ---------------------------------------------------------------------------
+# Unit tests: hybrid BM25 + cosine scoring and fallbacks
+# ---------------------------------------------------------------------------
+
+class TestHybridScoring:
+    def test_quantized_roundtrip(self):
+        """int8 quantization reconstructs weights within scale/2."""
+        ids = [1, 5, 9, 200]
+        weights = [0.9, 0.5, 0.1, 0.003]
+        out_ids, out_weights = _unpack_vector_q8(_pack_vector_q8(ids, weights))
+        assert list(out_ids) == ids
+        scale = max(weights) / 127.0
+        for orig, decoded in zip(weights, out_weights):
+            assert abs(orig - decoded) <= scale / 2
+
+    def test_quantized_roundtrip_zero_vector(self):
+        """All-zero weights survive the scale=1.0 special case."""
+        out_ids, out_weights = _unpack_vector_q8(_pack_vector_q8([3], [0.0]))
+        assert list(out_ids) == [3]
+        assert out_weights == [0.0]
+
+    def test_bm25_stored_at_build(self):
+        """The index build persists per-term df and per-posting bm25."""
+        conn = _make_vector_db()
+        assert conn.execute(
+            "SELECT COUNT(*) FROM tfidf_terms WHERE df > 0"
+        ).fetchone()[0] > 0
+        # "database" appears in two symbols
+        assert conn.execute(
+            "SELECT df FROM tfidf_terms WHERE term = 'database'"
+        ).fetchone()[0] == 2
+        assert conn.execute(
+            "SELECT COUNT(*) FROM tfidf_postings WHERE bm25 > 0"
+        ).fetchone()[0] > 0
+
+    def test_hybrid_blends_cosine_and_bm25(self):
+        """Scores are alpha*cosine + (1-alpha)*bm25/max_bm25."""
+        conn = _make_vector_db()
+        query_vec = _query_tf("authenticate user")
+        hybrid = dict(
+            (sid, score) for score, sid in _score_postings(conn, query_vec)
+        )
+        # Zeroing bm25 isolates the cosine component
+        conn.execute("UPDATE tfidf_postings SET bm25 = 0.0")
+        cosine_only = dict(
+            (sid, score) for score, sid in _score_postings(conn, query_vec)
+        )
+        assert set(hybrid) == set(cosine_only)
+        # The sole match holds the max BM25, so its blend is exact
+        assert hybrid[3] == pytest.approx(
+            _HYBRID_ALPHA * cosine_only[3] + (1.0 - _HYBRID_ALPHA)
+        )
+
+    def test_cosine_only_when_bm25_absent(self):
+        """Indexes without BM25 data score by pure cosine, in [0, 1]."""
+        conn = _make_vector_db()
+        conn.execute("UPDATE tfidf_postings SET bm25 = 0.0")
+        results = search_stored(conn, "database connection")
+        assert results and results[0]["name"] in ("open_database", "close_database")
+        assert all(0.0 < r["score"] <= 1.0 for r in results)
+
+    def test_legacy_postings_without_bm25_column(self):
+        """Postings tables from before the bm25/df columns still score."""
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            "CREATE TABLE symbols (id INTEGER PRIMARY KEY, file_id INT, name TEXT,"
+            " qualified_name TEXT, signature TEXT, kind TEXT,"
+            " line_start INT, line_end INT);\n"
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, language TEXT);\n"
+            "CREATE TABLE symbol_tfidf (symbol_id INTEGER PRIMARY KEY,"
+            " terms TEXT NOT NULL, normalized INTEGER DEFAULT 0, norm REAL DEFAULT 1.0);\n"
+            "CREATE TABLE tfidf_terms (id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE);\n"
+            "CREATE TABLE tfidf_postings (term_id INT, symbol_id INT, weight REAL NOT NULL);\n"
+        )
+        conn.execute("INSERT INTO files VALUES (1, 'a.py', 'python')")
+        conn.execute(
+            "INSERT INTO symbols VALUES "
+            "(1, 1, 'open_database', 'db.open_database', 'def open_database(p)', 'function', 1, 2)"
+        )
+        conn.execute("INSERT INTO tfidf_terms (id, term) VALUES (1, 'database')")
+        conn.execute("INSERT INTO tfidf_postings VALUES (1, 1, 1.0)")
+        results = search_stored(conn, "database")
+        assert results and results[0]["symbol_id"] == 1
+        assert results[0]["score"] == pytest.approx(1.0)
+
+    def test_readonly_legacy_index(self, tmp_path):
+        """A pre-series index opened readonly falls back without writes."""
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(
+            "CREATE TABLE symbols (id INTEGER PRIMARY KEY, file_id INT, name TEXT,"
+            " qualified_name TEXT, signature TEXT, kind TEXT,"
+            " line_start INT, line_end INT);\n"
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, language TEXT);\n"
+            "CREATE TABLE symbol_tfidf (symbol_id INTEGER PRIMARY KEY,"
+            " terms TEXT NOT NULL, updated_at TEXT);\n"
+        )
+        conn.execute("INSERT INTO files VALUES (1, 'a.py', 'python')")
+        conn.execute(
+            "INSERT INTO symbols VALUES "
+            "(1, 1, 'open_database', 'db.open_database', 'def open_database(p)', 'function', 1, 2)"
+        )
+        conn.execute(
+            "INSERT INTO symbol_tfidf (symbol_id, terms) VALUES (1, ?)",
+            (json.dumps({"database": 0.6, "open": 0.4}),),
+        )
+        conn.commit()
+        conn.close()
+
+        ro = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        ro.row_factory = sqlite3.Row
+        try:
+            results = search_stored(ro, "database")
+            assert results and results[0]["symbol_id"] == 1
+            assert results[0]["score"] > 0
+        finally:
+            ro.close()
+
+
 # ---------------------------------------------------------------------------
 # CLI tests
 # ---------------------------------------------------------------------------